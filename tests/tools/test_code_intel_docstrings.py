@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+
+from vibe.core.tools.builtins.code_intel.docstrings import extract_docstring
+from vibe.core.tools.builtins.code_intel.parser import CodeParser
+
+pytest.importorskip("tree_sitter")
+pytest.importorskip("tree_sitter_python")
+
+
+def _docstring(source: bytes) -> str | None:
+    tree = CodeParser().parse_bytes(source, "python")
+    assert tree is not None
+    return extract_docstring(tree.root_node.children[0], "python", source)
+
+
+@pytest.mark.parametrize(
+    "literal",
+    [
+        b'"""Doc."""',
+        b"'''Doc.'''",
+        b'"Doc."',
+        b'r"""Doc."""',
+        b'u"Doc."',
+        b'b"""Doc."""',
+        b'f"""Doc."""',
+        b'F"Doc."',
+        b'rb"""Doc."""',
+        b'Br"""Doc."""',
+        b'fR"Doc."',
+    ],
+)
+def test_string_literal_docstring(literal: bytes) -> None:
+    assert _docstring(b"def f():\n    " + literal + b"\n    pass\n") == "Doc."
+
+
+def test_multiline_docstring_is_dedented() -> None:
+    source = b'class C:\n    """Summary.\n\n    Details.\n    """\n'
+
+    assert _docstring(source) == "Summary.\n\nDetails."
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b"pass", b"x = 1", b'rb = "not a docstring"', b'"sep".join(items)', b"bf(1)"],
+)
+def test_body_without_docstring(body: bytes) -> None:
+    assert _docstring(b"def f():\n    " + body + b"\n") is None
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import gc
+from pathlib import Path
+
+import pytest
+
+from vibe.core.tools.builtins.code_intel.parser import CodeParser
+
+pytest.importorskip("tree_sitter")
+pytest.importorskip("tree_sitter_python")
+
+# Larger than the page cache readahead and the stdlib's buffer sizes
+LARGE_SIZE = 2 * 1024 * 1024
+
+
+@pytest.fixture
+def parser() -> CodeParser:
+    return CodeParser()
+
+
+def _write_large_module(path: Path) -> None:
+    line = "value = 1\n"
+    path.write_text("def first():\n    pass\n" + line * (LARGE_SIZE // len(line)))
+
+
+def test_large_file_tree_text_is_readable(tmp_path: Path, parser: CodeParser) -> None:
+    path = tmp_path / "large.py"
+    _write_large_module(path)
+
+    tree = parser.parse_file(path)
+
+    assert tree is not None
+    assert tree.root_node.children[0].text == b"def first():\n    pass"
+
+
+def test_cached_large_file_tree_text_is_readable(
+    tmp_path: Path, parser: CodeParser
+) -> None:
+    path = tmp_path / "large.py"
+    _write_large_module(path)
+    parser.parse_file(path)
+
+    tree = parser.parse_file(path)
+
+    assert tree is not None
+    assert tree.root_node.children[-1].text == b"value = 1"
+
+
+def test_large_file_tree_outlives_the_cache(tmp_path: Path, parser: CodeParser) -> None:
+    path = tmp_path / "large.py"
+    _write_large_module(path)
+    tree = parser.parse_file(path)
+
+    parser.clear_cache()
+    gc.collect()
+
+    assert tree is not None
+    assert tree.root_node.children[0].children[1].text == b"first"
+
+
+def test_in_place_edit_leaves_old_tree_text(tmp_path: Path, parser: CodeParser) -> None:
+    path = tmp_path / "large.py"
+    _write_large_module(path)
+    tree = parser.parse_file(path)
+
+    with path.open("r+b") as f:
+        f.write(b"def other():")
+
+    assert tree is not None
+    assert tree.root_node.children[0].text == b"def first():\n    pass"
+
+
+def test_truncated_file_leaves_old_tree_text(
+    tmp_path: Path, parser: CodeParser
+) -> None:
+    path = tmp_path / "large.py"
+    _write_large_module(path)
+    tree = parser.parse_file(path)
+
+    path.write_bytes(b"")
+
+    assert tree is not None
+    assert tree.root_node.children[-1].text == b"value = 1"
+    empty = parser.parse_file(path)
+    assert empty is not None
+    assert empty.root_node.child_count == 0
+
+
+def test_unchanged_file_returns_cached_tree(tmp_path: Path, parser: CodeParser) -> None:
+    path = tmp_path / "small.py"
+    path.write_text("import os\n")
+
+    first = parser.parse_file(path)
+    second = parser.parse_file(path)
+
+    assert first is not None
+    assert second is first
+
+
+def test_edited_file_is_reparsed(tmp_path: Path, parser: CodeParser) -> None:
+    path = tmp_path / "small.py"
+    path.write_text("import os\n")
+    parser.parse_file(path)
+
+    path.write_text("import os\nimport sys\n")
+    tree = parser.parse_file(path)
+
+    assert tree is not None
+    assert [child.text for child in tree.root_node.children] == [
+        b"import os",
+        b"import sys",
+    ]
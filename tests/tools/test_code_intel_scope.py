@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import pytest
+
+from vibe.core.tools.builtins.code_intel.parser import CodeParser
+from vibe.core.tools.builtins.code_intel.scope import (
+    Scope,
+    ScopeAnalyzer,
+    ScopeType,
+    get_scope_info,
+)
+
+pytest.importorskip("tree_sitter")
+pytest.importorskip("tree_sitter_python")
+
+SOURCE = b"""\
+import os
+
+
+class Outer:
+    attr = 1
+
+    def method(self):
+        def inner():
+            return lambda: 1
+
+        return inner
+
+    class Nested:
+        def deep(self):
+            if True:
+                pass
+
+
+def top(a, b):
+    class Local:
+        pass
+
+    return Local
+
+
+async def last():
+    pass
+"""
+
+
+def _reference_scopes(analyzer: ScopeAnalyzer, node, scope: Scope) -> None:
+    """The recursive walk the cursor walk must match."""
+    for child in node.children:
+        if scope_type := analyzer.scope_creators.get(child.type):
+            new_scope = Scope(
+                type=scope_type,
+                name=analyzer._get_scope_name(child, SOURCE),
+                start_line=child.start_point[0] + 1,
+                end_line=child.end_point[0] + 1,
+                parent=scope,
+                node=child,
+            )
+            scope.children.append(new_scope)
+            _reference_scopes(analyzer, child, new_scope)
+        else:
+            _reference_scopes(analyzer, child, scope)
+
+
+def _shape(scope: Scope) -> tuple:
+    return (
+        scope.type,
+        scope.name,
+        scope.start_line,
+        scope.end_line,
+        scope.qualified_prefix,
+        [_shape(child) for child in scope.children],
+    )
+
+
+@pytest.fixture
+def tree():
+    tree = CodeParser().parse_bytes(SOURCE, "python")
+    assert tree is not None
+    return tree
+
+
+def test_scope_tree_matches_recursive_walk(tree) -> None:
+    analyzer = ScopeAnalyzer("python")
+
+    root = analyzer.build_scope_tree(tree, SOURCE)
+
+    expected = Scope(
+        type=ScopeType.GLOBAL,
+        name=None,
+        start_line=1,
+        end_line=tree.root_node.end_point[0] + 1,
+        node=tree.root_node,
+    )
+    _reference_scopes(analyzer, tree.root_node, expected)
+    assert _shape(root) == _shape(expected)
+
+
+def test_scope_tree_nesting(tree) -> None:
+    root = ScopeAnalyzer("python").build_scope_tree(tree, SOURCE)
+
+    assert [child.qualified_prefix for child in root.children] == [
+        "Outer",
+        "top",
+        "last",
+    ]
+    outer = root.children[0]
+    assert [child.qualified_prefix for child in outer.children] == [
+        "Outer.method",
+        "Outer.Nested",
+    ]
+    assert outer.children[0].children[0].qualified_prefix == "Outer.method.inner"
+    assert outer.children[1].children[0].qualified_prefix == "Outer.Nested.deep"
+    assert root.children[1].children[0].qualified_prefix == "top.Local"
+
+
+def test_empty_module_has_only_the_global_scope() -> None:
+    tree = CodeParser().parse_bytes(b"", "python")
+    assert tree is not None
+
+    root = ScopeAnalyzer("python").build_scope_tree(tree, b"")
+
+    assert root.type == ScopeType.GLOBAL
+    assert root.children == []
+
+
+@pytest.mark.parametrize(
+    ("line", "chain"),
+    [
+        (1, [None]),
+        (5, [None, "Outer"]),
+        (9, [None, "Outer", "method", "inner"]),
+        (16, [None, "Outer", "Nested", "deep"]),
+        (20, [None, "top", "Local"]),
+        (23, [None, "top"]),
+        (27, [None, "last"]),
+    ],
+)
+def test_scope_info_chain(tree, line: int, chain: list[str | None]) -> None:
+    info = get_scope_info(tree, "python", SOURCE, line)
+
+    assert [scope["name"] for scope in info["scope_chain"]] == chain
+    assert info["scope_name"] == chain[-1]
+
+
+def test_scope_info_matches_the_full_tree(tree) -> None:
+    analyzer = ScopeAnalyzer("python")
+    root = analyzer.build_scope_tree(tree, SOURCE)
+
+    for line in range(1, SOURCE.count(b"\n") + 1):
+        expected = analyzer.find_scope_at(root, line)
+        info = get_scope_info(tree, "python", SOURCE, line)
+        assert info["scope_name"] == expected.name, line
+        assert info["current_scope"] == expected.type.label, line
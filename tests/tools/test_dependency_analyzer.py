@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sqlite3
+
+import pytest
+
+from vibe.core.paths.global_paths import DEPS_CACHE_FILE
+from vibe.core.tools.builtins import dependency_analyzer
+from vibe.core.tools.builtins.dependency_analyzer import (
+    DependencyAnalyzer,
+    DependencyArgs,
+    DependencyConfig,
+    DependencyState,
+    DepOp,
+    _ImportsCache,
+    _read_source,
+)
+
+IMPORTS = [{"module": "os", "names": [], "line": 1, "is_relative": False}]
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "deps.sqlite"
+
+
+def _rows(db_path: Path) -> list[tuple[str, bytes]]:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT path, hash FROM imports ORDER BY path").fetchall()
+
+
+def test_entry_is_read_back_after_reopen(db_path: Path) -> None:
+    cache = _ImportsCache(db_path)
+    cache.put("/src/a.py", b"h1", IMPORTS)
+    cache.close()
+
+    cache = _ImportsCache(db_path)
+    assert cache.get("/src/a.py", b"h1") == IMPORTS
+    cache.close()
+
+
+def test_changed_contents_miss(db_path: Path) -> None:
+    cache = _ImportsCache(db_path)
+    cache.put("/src/a.py", b"h1", IMPORTS)
+    cache.close()
+
+    cache = _ImportsCache(db_path)
+    assert cache.get("/src/a.py", b"h2") is None
+    assert cache.get("/src/b.py", b"h1") is None
+    cache.close()
+
+
+def test_new_hash_replaces_the_old_row(db_path: Path) -> None:
+    cache = _ImportsCache(db_path)
+    cache.put("/src/a.py", b"h1", IMPORTS)
+    cache.close()
+
+    cache = _ImportsCache(db_path)
+    cache.put("/src/a.py", b"h2", [])
+    cache.close()
+
+    assert _rows(db_path) == [("/src/a.py", b"h2")]
+
+
+def test_version_change_drops_entries(
+    db_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = _ImportsCache(db_path)
+    cache.put("/src/a.py", b"h1", IMPORTS)
+    cache.close()
+
+    monkeypatch.setattr(dependency_analyzer, "_imports_cache_version", lambda: 12345)
+    cache = _ImportsCache(db_path)
+    assert cache.get("/src/a.py", b"h1") is None
+    cache.close()
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 12345
+    assert _rows(db_path) == []
+
+
+def test_rows_of_deleted_files_are_pruned(tmp_path: Path, db_path: Path) -> None:
+    root = tmp_path / "src"
+    root.mkdir()
+    kept = root / "kept.py"
+    kept.write_text("import os\n")
+    outside = tmp_path / "src2" / "gone.py"
+
+    cache = _ImportsCache(db_path)
+    for path in (kept, root / "gone.py", root / "pkg" / "gone.py", outside):
+        cache.put(str(path), b"h1", IMPORTS)
+    cache.close()
+
+    cache = _ImportsCache(db_path)
+    cache.prune(root)
+    cache.close()
+
+    # Rows outside the pruned directory are left alone
+    assert _rows(db_path) == [(str(kept), b"h1"), (str(outside), b"h1")]
+
+
+def test_unusable_database_falls_back_to_memo(tmp_path: Path) -> None:
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+
+    cache = _ImportsCache(blocker / "deps.sqlite")
+    cache.put("/src/a.py", b"h1", IMPORTS)
+    assert cache.get("/src/a.py", b"h1") is None
+    cache.prune(tmp_path)
+    cache.close()
+
+
+def test_large_source_is_read_whole(tmp_path: Path) -> None:
+    path = tmp_path / "large.py"
+    content = b"import os\n" + b"x = 1\n" * (1 << 20)
+    path.write_bytes(content)
+
+    source = _read_source(path)
+
+    assert type(source) is bytes
+    assert source == content
+
+
+def _make_project(tmp_path: Path) -> Path:
+    tmp_path.mkdir()
+    (tmp_path / "target.py").write_text("VALUE = 1\n")
+    (tmp_path / "user.py").write_text("import target\n")
+    (tmp_path / "other.py").write_text("import os\n")
+    return tmp_path
+
+
+def _make_analyzer(tmp_path: Path, **config) -> DependencyAnalyzer:
+    return DependencyAnalyzer(
+        config=DependencyConfig(workdir=tmp_path, **config), state=DependencyState()
+    )
+
+
+@pytest.mark.asyncio
+async def test_dependents_are_found_from_the_cache(tmp_path: Path) -> None:
+    pytest.importorskip("tree_sitter_python")
+    project = _make_project(tmp_path / "project")
+    args = DependencyArgs(operation=DepOp.DEPENDENTS, target="target.py")
+
+    first = await _make_analyzer(project).run(args)
+    second = await _make_analyzer(project).run(args)
+
+    assert first.dependents == second.dependents == ["user.py"]
+    assert {path for path, _ in _rows(DEPS_CACHE_FILE.path)} == {
+        str(project / name) for name in ("target.py", "user.py", "other.py")
+    }
+
+
+@pytest.mark.asyncio
+async def test_dependents_run_prunes_deleted_files(tmp_path: Path) -> None:
+    pytest.importorskip("tree_sitter_python")
+    project = _make_project(tmp_path / "project")
+    args = DependencyArgs(operation=DepOp.DEPENDENTS, target="target.py")
+    await _make_analyzer(project).run(args)
+
+    (project / "other.py").unlink()
+    await _make_analyzer(project).run(args)
+
+    assert str(project / "other.py") not in {
+        path for path, _ in _rows(DEPS_CACHE_FILE.path)
+    }
+
+
+@pytest.mark.asyncio
+async def test_dependents_work_when_the_cache_cannot_be_opened(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("tree_sitter_python")
+    project = _make_project(tmp_path / "project")
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    monkeypatch.setattr(
+        dependency_analyzer,
+        "DEPS_CACHE_FILE",
+        type("_File", (), {"path": blocker / "deps.sqlite"})(),
+    )
+
+    result = await _make_analyzer(project).run(
+        DependencyArgs(operation=DepOp.DEPENDENTS, target="target.py")
+    )
+
+    assert result.dependents == ["user.py"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("depth", "graph"),
+    [
+        (0, {"a.py": ["b.py"]}),
+        (1, {"a.py": ["b.py"], "b.py": ["c.py"]}),
+        (2, {"a.py": ["b.py"], "b.py": ["c.py"], "c.py": ["a.py", "b.py"]}),
+    ],
+)
+async def test_graph_follows_imports_by_depth(
+    tmp_path: Path, depth: int, graph: dict[str, list[str]]
+) -> None:
+    pytest.importorskip("tree_sitter_python")
+    (tmp_path / "a.py").write_text("import b\n")
+    (tmp_path / "b.py").write_text("import c\nimport os\n")
+    (tmp_path / "c.py").write_text("import a\nimport b\n")
+
+    result = await _make_analyzer(tmp_path).run(
+        DependencyArgs(operation=DepOp.GRAPH, target="a.py", depth=depth)
+    )
+
+    assert result.graph == graph
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from pathlib import Path
+import shutil
+import subprocess
+
+import pytest
+
+from vibe.core.tools.builtins.diff import (
+    Diff,
+    DiffArgs,
+    DiffConfig,
+    DiffMode,
+    DiffState,
+)
+
+
+def _make_diff(tmp_path: Path, **config) -> Diff:
+    return Diff(config=DiffConfig(workdir=tmp_path, **config), state=DiffState())
+
+
+def _write_pair(tmp_path: Path, name: str, count: int) -> tuple[str, str]:
+    (tmp_path / f"{name}_a.txt").write_text("".join(f"old {i}\n" for i in range(count)))
+    (tmp_path / f"{name}_b.txt").write_text("".join(f"new {i}\n" for i in range(count)))
+    return f"{name}_a.txt", f"{name}_b.txt"
+
+
+def _files_args(path: str, path2: str) -> DiffArgs:
+    return DiffArgs(mode=DiffMode.FILES, path=path, path2=path2)
+
+
+@pytest.mark.asyncio
+async def test_files_diff_counts_changes(tmp_path: Path) -> None:
+    tool = _make_diff(tmp_path)
+    a, b = _write_pair(tmp_path, "small", 3)
+
+    result = await tool.run(_files_args(a, b))
+
+    assert result.additions == 3
+    assert result.deletions == 3
+    assert result.files_changed == 1
+    assert not result.was_truncated
+    assert result.overflow_path is None
+
+
+@pytest.mark.asyncio
+async def test_identical_files_have_no_differences(tmp_path: Path) -> None:
+    tool = _make_diff(tmp_path)
+    (tmp_path / "a.txt").write_text("same\n")
+    (tmp_path / "b.txt").write_text("same\n")
+
+    result = await tool.run(_files_args("a.txt", "b.txt"))
+
+    assert result.diff == "(no differences)"
+    assert result.files_changed == 0
+
+
+@pytest.mark.asyncio
+async def test_truncated_diff_is_written_in_full(tmp_path: Path) -> None:
+    tool = _make_diff(tmp_path, max_output_lines=10)
+    a, b = _write_pair(tmp_path, "big", 50)
+
+    result = await tool.run(_files_args(a, b))
+
+    assert result.was_truncated
+    assert result.overflow_path is not None
+    assert not result.overflow_truncated
+    assert f"full diff in {result.overflow_path}" in result.diff
+    full = result.overflow_path.read_text()
+    assert full.count("\n+new ") == 50
+    assert full.count("\n-old ") == 50
+    assert full.startswith(result.diff.split("\n... (output truncated")[0])
+
+
+@pytest.mark.asyncio
+async def test_overflow_file_stops_at_limit(tmp_path: Path) -> None:
+    tool = _make_diff(tmp_path, max_output_lines=10, max_overflow_chars=100)
+    a, b = _write_pair(tmp_path, "big", 50)
+
+    result = await tool.run(_files_args(a, b))
+
+    assert result.overflow_path is not None
+    assert result.overflow_truncated
+    assert "full diff" not in result.diff
+    shown = result.diff.split("\n... (output truncated")[0]
+    assert len(result.overflow_path.read_text()) == len(shown) + 100
+
+
+@pytest.mark.asyncio
+async def test_overflow_file_is_replaced_by_the_next(tmp_path: Path) -> None:
+    tool = _make_diff(tmp_path, max_output_lines=10)
+    first = await tool.run(_files_args(*_write_pair(tmp_path, "one", 50)))
+    second = await tool.run(_files_args(*_write_pair(tmp_path, "two", 50)))
+
+    assert first.overflow_path is not None and second.overflow_path is not None
+    assert not first.overflow_path.exists()
+    assert second.overflow_path.exists()
+    assert tool.state.overflow_path == second.overflow_path
+
+    # The comparison whose file was deleted is computed again
+    again = await tool.run(_files_args("one_a.txt", "one_b.txt"))
+    assert again.overflow_path is not None and again.overflow_path.exists()
+    assert not second.overflow_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_files_reuse_the_comparison(tmp_path: Path) -> None:
+    tool = _make_diff(tmp_path)
+    a, b = _write_pair(tmp_path, "small", 3)
+
+    first = await tool.run(_files_args(a, b))
+    second = await tool.run(_files_args(a, b))
+
+    assert second is first
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    if not shutil.which("git"):
+        pytest.skip("git is not installed")
+
+    def git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.email", "test@example.com")
+    git("config", "user.name", "Test")
+    for i in range(3):
+        (tmp_path / f"f{i}.txt").write_text("".join(f"{j}\n" for j in range(20)))
+    git("add", ".")
+    git("commit", "-q", "-m", "init")
+    for i in range(3):
+        (tmp_path / f"f{i}.txt").write_text("".join(f"{j}!\n" for j in range(20)))
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_git_diff_streams_stats_past_the_shown_lines(git_repo: Path) -> None:
+    tool = _make_diff(git_repo, max_output_lines=5, max_overflow_chars=0)
+
+    result = await tool.run(DiffArgs(mode=DiffMode.GIT))
+
+    assert result.additions == 60
+    assert result.deletions == 60
+    assert result.was_truncated
+    assert result.overflow_path is None
+    assert result.diff.count("\n") == 5 + 2
+
+
+@pytest.mark.asyncio
+async def test_truncated_git_diff_is_written_in_full(git_repo: Path) -> None:
+    tool = _make_diff(git_repo, max_output_lines=5)
+
+    result = await tool.run(DiffArgs(mode=DiffMode.GIT))
+
+    assert result.overflow_path is not None
+    full = result.overflow_path.read_text()
+    assert full.count("\ndiff --git") + full.startswith("diff --git") == 3
+    assert full.count("\n+") - full.count("\n+++") == 60
+
+
+@pytest.mark.asyncio
+async def test_git_diff_summarizes_when_probe_is_over_limit(git_repo: Path) -> None:
+    tool = _make_diff(git_repo, max_probe_files=2)
+
+    result = await tool.run(DiffArgs(mode=DiffMode.GIT))
+
+    assert result.diff.startswith("(summary only")
+    assert (result.files_changed, result.additions, result.deletions) == (3, 60, 60)
+    assert result.was_truncated
+
+
+@pytest.mark.asyncio
+async def test_git_diff_without_changes(git_repo: Path) -> None:
+    tool = _make_diff(git_repo)
+
+    result = await tool.run(DiffArgs(mode=DiffMode.GIT_STAGED))
+
+    assert result.diff == "(no differences)"
+    assert result.files_changed == 0
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from pathlib import Path
+import shutil
+import subprocess
+
+import pytest
+
+from vibe.core.tools.base import ToolError
+from vibe.core.tools.builtins.git import Git, GitArgs, GitConfig, GitOperation, GitState
+
+pytestmark = pytest.mark.skipif(not shutil.which("git"), reason="git is not installed")
+
+
+def _make_git(tmp_path: Path, **config) -> Git:
+    return Git(config=GitConfig(workdir=tmp_path, **config), state=GitState())
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    def git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.email", "test@example.com")
+    git("config", "user.name", "Test")
+    for i in range(3):
+        (tmp_path / "log.txt").write_text(f"{i}\n")
+        git("add", ".")
+        git("commit", "-q", "-m", f"commit {i}")
+    return tmp_path
+
+
+def _add_untracked(repo: Path, count: int) -> None:
+    for i in range(count):
+        (repo / f"untracked_{i:05}_{'x' * 40}.txt").write_text("")
+
+
+@pytest.mark.asyncio
+async def test_status_is_truncated_at_max_output_lines(git_repo: Path) -> None:
+    _add_untracked(git_repo, 30)
+    tool = _make_git(git_repo, max_output_lines=10)
+
+    result = await tool.run(GitArgs(operation=GitOperation.STATUS))
+
+    lines = result.output.splitlines()
+    assert result.was_truncated
+    assert len(lines) == 11
+    assert lines[0].startswith("## ")
+    assert lines[-1] == "... (output truncated)"
+
+
+@pytest.mark.asyncio
+async def test_output_larger_than_the_pipe_buffer_is_drained(git_repo: Path) -> None:
+    _add_untracked(git_repo, 2000)
+    tool = _make_git(git_repo, max_output_lines=5, timeout=30)
+
+    result = await tool.run(GitArgs(operation=GitOperation.STATUS))
+
+    assert result.success
+    assert result.was_truncated
+    assert len(result.output.splitlines()) == 6
+
+
+@pytest.mark.asyncio
+async def test_output_within_the_limit_is_not_truncated(git_repo: Path) -> None:
+    _add_untracked(git_repo, 3)
+    tool = _make_git(git_repo, max_output_lines=4)
+
+    result = await tool.run(GitArgs(operation=GitOperation.STATUS))
+
+    assert not result.was_truncated
+    assert len(result.output.splitlines()) == 4
+
+
+@pytest.mark.asyncio
+async def test_log_lists_recent_commits(git_repo: Path) -> None:
+    tool = _make_git(git_repo)
+
+    result = await tool.run(GitArgs(operation=GitOperation.LOG, num_entries=2))
+
+    lines = result.output.splitlines()
+    assert len(lines) == 2
+    assert lines[0].endswith("commit 2")
+    assert lines[1].endswith("commit 1")
+
+
+@pytest.mark.asyncio
+async def test_add_shows_the_staged_status(git_repo: Path) -> None:
+    (git_repo / "new.txt").write_text("new\n")
+    tool = _make_git(git_repo)
+
+    result = await tool.run(GitArgs(operation=GitOperation.ADD, path="new.txt"))
+
+    assert result.output.startswith("Staged: new.txt\n\n## ")
+    assert "A  new.txt" in result.output.splitlines()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("operation", [GitOperation.STATUS, GitOperation.ADD])
+async def test_outside_a_repository(tmp_path: Path, operation: GitOperation) -> None:
+    tool = _make_git(tmp_path)
+
+    with pytest.raises(ToolError, match="Not a git repository"):
+        await tool.run(GitArgs(operation=operation, path="."))
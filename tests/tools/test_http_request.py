@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+
+from vibe.core.tools.builtins.http_request import (
+    HttpRequest,
+    HttpRequestArgs,
+    HttpRequestConfig,
+    HttpRequestState,
+)
+
+
+@pytest.fixture
+def http_request(tmp_path):
+    config = HttpRequestConfig(workdir=tmp_path)
+    return HttpRequest(config=config, state=HttpRequestState())
+
+
+@pytest.mark.asyncio
+async def test_cookies_are_not_carried_between_requests(http_request):
+    with respx.mock(base_url="https://example.com") as mock_api:
+        mock_api.get("/login").mock(
+            return_value=httpx.Response(
+                200, headers={"Set-Cookie": "session=secret; Path=/"}
+            )
+        )
+        route = mock_api.get("/profile").mock(return_value=httpx.Response(200))
+
+        await http_request.run(HttpRequestArgs(url="https://example.com/login"))
+        await http_request.run(HttpRequestArgs(url="https://example.com/profile"))
+
+    assert "cookie" not in route.calls.last.request.headers
+
+
+@pytest.mark.asyncio
+async def test_response_body_is_truncated_at_limit(tmp_path):
+    config = HttpRequestConfig(workdir=tmp_path, max_response_bytes=10)
+    tool = HttpRequest(config=config, state=HttpRequestState())
+
+    with respx.mock(base_url="https://example.com") as mock_api:
+        mock_api.get("/big").mock(return_value=httpx.Response(200, text="x" * 100))
+
+        result = await tool.run(HttpRequestArgs(url="https://example.com/big"))
+
+    assert result.body == "x" * 10
+    assert result.was_truncated
+    assert tool.state.request_count == 1
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import base64
+import os
+from pathlib import Path
+import struct
+from types import SimpleNamespace
+
+import pytest
+
+from vibe.core.tools.builtins import image_view
+from vibe.core.tools.builtins.image_view import (
+    _READ_CHUNK,
+    ImageView,
+    ImageViewArgs,
+    ImageViewConfig,
+    ImageViewState,
+    _b64encode,
+    _get_image_dimensions,
+)
+
+
+def _png(width: int, height: int) -> bytes:
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + struct.pack(">I", 13)
+        + b"IHDR"
+        + struct.pack(">II", width, height)
+        + b"\x08\x06\x00\x00\x00"
+    )
+
+
+def _jpeg(width: int, height: int) -> bytes:
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x00" * 9
+    sof = b"\xff\xc0" + struct.pack(">HBHH", 17, 8, height, width) + b"\x00" * 10
+    return b"\xff\xd8" + app0 + sof
+
+
+def _gif(width: int, height: int) -> bytes:
+    return b"GIF89a" + struct.pack("<HH", width, height) + b"\x00" * 3
+
+
+def _bmp(width: int, height: int) -> bytes:
+    return b"BM" + b"\x00" * 16 + struct.pack("<Ii", width, height) + b"\x00" * 8
+
+
+def _webp_lossy(width: int, height: int) -> bytes:
+    return (
+        b"RIFF\x00\x00\x00\x00WEBPVP8 "
+        + b"\x00" * 10
+        + struct.pack("<HH", width, height)
+    )
+
+
+def _webp_lossless(width: int, height: int) -> bytes:
+    bits = (width - 1) | ((height - 1) << 14)
+    return b"RIFF\x00\x00\x00\x00WEBPVP8L" + b"\x00" * 5 + struct.pack("<I", bits)
+
+
+@pytest.mark.parametrize(
+    "make", [_png, _jpeg, _gif, _webp_lossy, _webp_lossless], ids=lambda f: f.__name__
+)
+def test_dimensions_are_read_from_the_header(make) -> None:
+    assert _get_image_dimensions(make(640, 480)) == (640, 480)
+
+
+def test_top_down_bmp_height_is_positive() -> None:
+    assert _get_image_dimensions(_bmp(640, -480)) == (640, 480)
+
+
+@pytest.mark.parametrize(
+    ("make", "end"),
+    [
+        (_png, 24),
+        (_jpeg, 29),
+        (_gif, 10),
+        (_bmp, 26),
+        (_webp_lossy, 30),
+        (_webp_lossless, 25),
+    ],
+    ids=lambda v: getattr(v, "__name__", str(v)),
+)
+def test_header_cut_inside_the_dimensions_has_none(make, end: int) -> None:
+    data = make(640, 480)
+    assert _get_image_dimensions(data[:end]) == (640, 480)
+
+    assert _get_image_dimensions(data[: end - 1]) == (0, 0)
+
+
+def test_unknown_format_has_no_dimensions() -> None:
+    assert _get_image_dimensions(b"not an image") == (0, 0)
+
+
+def _make_image_view(tmp_path: Path) -> ImageView:
+    return ImageView(config=ImageViewConfig(workdir=tmp_path), state=ImageViewState())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("padding", [0, 1, 2])
+async def test_large_image_is_encoded_like_b64encode(
+    tmp_path: Path, padding: int
+) -> None:
+    # Not a multiple of the chunk size, and not of 3 either
+    data = _png(640, 480) + os.urandom(2 * _READ_CHUNK + 1000 + padding)
+    (tmp_path / "big.png").write_bytes(data)
+
+    result = await _make_image_view(tmp_path).run(ImageViewArgs(path="big.png"))
+
+    assert result.base64_data == base64.b64encode(data).decode("ascii")
+    assert result.size_bytes == len(data)
+    assert (result.width, result.height) == (640, 480)
+    assert not result.was_resized
+
+
+@pytest.mark.asyncio
+async def test_header_past_the_first_chunk_is_found(tmp_path: Path) -> None:
+    # JPEG segments hold at most 64 KiB, so enough of them push the frame
+    # header past the first read
+    app = b"\xff\xe1" + struct.pack(">H", 0xFFFF) + b"\x00" * 0xFFFD
+    count = _READ_CHUNK // len(app) + 1
+    data = b"\xff\xd8" + app * count + _jpeg(320, 200)[2:]
+    assert data.index(b"\xff\xc0") > _READ_CHUNK
+    (tmp_path / "deep.jpg").write_bytes(data)
+
+    result = await _make_image_view(tmp_path).run(ImageViewArgs(path="deep.jpg"))
+
+    assert (result.width, result.height) == (320, 200)
+    assert result.size_bytes == len(data)
+    assert result.base64_data == base64.b64encode(data).decode("ascii")
+
+
+def test_b64encode_uses_pybase64_when_installed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[bytes] = []
+
+    def b64encode_as_string(data: bytes) -> str:
+        calls.append(data)
+        return base64.b64encode(data).decode("ascii")
+
+    monkeypatch.setattr(
+        image_view, "pybase64", SimpleNamespace(b64encode_as_string=b64encode_as_string)
+    )
+
+    assert _b64encode(b"abcd") == "YWJjZA=="
+    assert calls == [b"abcd"]
+
+
+def test_b64encode_falls_back_to_the_stdlib(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(image_view, "pybase64", None)
+
+    assert _b64encode(b"abcd") == "YWJjZA=="
+
+
+def test_pybase64_matches_the_stdlib() -> None:
+    pybase64 = pytest.importorskip("pybase64")
+    data = os.urandom(3 * 1000 + 2)
+
+    assert pybase64.b64encode_as_string(data) == base64.b64encode(data).decode()
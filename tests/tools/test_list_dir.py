@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+from pathlib import Path
+
+from pydantic import ValidationError
+import pytest
+
+from vibe.core.tools.builtins import list_dir
+from vibe.core.tools.builtins.list_dir import (
+    ListDir,
+    ListDirArgs,
+    ListDirConfig,
+    ListDirState,
+)
+
+
+def _make_list_dir(tmp_path: Path, **config) -> ListDir:
+    return ListDir(
+        config=ListDirConfig(workdir=tmp_path, **config), state=ListDirState()
+    )
+
+
+def _reference_walk(
+    base: Path, config: ListDirConfig, max_depth: int, include_hidden: bool = False
+) -> tuple[list[tuple[str, bool]], bool]:
+    """The plain recursive walk the listing must match."""
+    entries: list[tuple[str, bool]] = []
+
+    def collect(dir_path: Path, depth: int) -> bool:
+        items = sorted(
+            dir_path.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower())
+        )
+        for item in items:
+            if len(entries) >= config.max_entries:
+                return False
+            if not include_hidden and item.name.startswith("."):
+                continue
+            if config.is_excluded(item.name):
+                continue
+            entries.append((str(item.relative_to(base)), item.is_dir()))
+            if item.is_dir() and depth < max_depth:
+                if not collect(item, depth + 1):
+                    return False
+        return True
+
+    return entries, not collect(base, 0)
+
+
+def _make_tree(root: Path) -> Path:
+    for a in ("Alpha", "beta", "gamma"):
+        for b in ("one", "Two"):
+            leaf = root / a / b / "deep"
+            leaf.mkdir(parents=True)
+            (leaf / "file.txt").write_text("x")
+            (root / a / b / f"{b}.py").write_text("x" * 10)
+        (root / a / "README.md").write_text("x")
+    (root / ".hidden").mkdir()
+    (root / ".hidden" / "secret.txt").write_text("x")
+    (root / "node_modules" / "pkg").mkdir(parents=True)
+    (root / "pkg.egg-info").mkdir()
+    (root / "top.txt").write_text("x")
+    return root
+
+
+def _listed(result: list_dir.ListDirResult) -> list[tuple[str, bool]]:
+    return [(entry.path, entry.is_dir) for entry in result.entries]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_entries", [1, 4, 7, 20, 500])
+@pytest.mark.parametrize("scan_workers", [1, 2, 8])
+async def test_recursive_listing_matches_recursive_walk(
+    tmp_path: Path, max_entries: int, scan_workers: int
+) -> None:
+    root = _make_tree(tmp_path)
+    tool = _make_list_dir(root, max_entries=max_entries, scan_workers=scan_workers)
+
+    result = await tool.run(ListDirArgs(recursive=True, show_size=False))
+
+    expected, truncated = _reference_walk(root, tool.config, tool.config.max_depth)
+    assert _listed(result) == expected
+    assert result.was_truncated == truncated
+    assert result.total_dirs == sum(is_dir for _, is_dir in expected)
+    assert result.total_files == len(expected) - result.total_dirs
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_depth", [0, 1, 2])
+async def test_recursive_listing_stops_at_max_depth(
+    tmp_path: Path, max_depth: int
+) -> None:
+    root = _make_tree(tmp_path)
+    tool = _make_list_dir(root)
+
+    result = await tool.run(
+        ListDirArgs(recursive=True, include_hidden=True, max_depth=max_depth)
+    )
+
+    expected, _ = _reference_walk(root, tool.config, max_depth, include_hidden=True)
+    assert _listed(result) == expected
+
+
+@pytest.mark.asyncio
+async def test_listing_skips_hidden_and_excluded(tmp_path: Path) -> None:
+    root = _make_tree(tmp_path)
+    tool = _make_list_dir(root)
+
+    result = await tool.run(ListDirArgs())
+
+    assert _listed(result) == [
+        ("Alpha", True),
+        ("beta", True),
+        ("gamma", True),
+        ("top.txt", False),
+    ]
+    assert not result.was_truncated
+
+
+@pytest.mark.asyncio
+async def test_listing_reports_size_and_modified_time(tmp_path: Path) -> None:
+    root = _make_tree(tmp_path)
+    tool = _make_list_dir(root)
+
+    result = await tool.run(ListDirArgs(path="Alpha/one", show_modified=True))
+
+    by_name = {entry.name: entry for entry in result.entries}
+    assert by_name["one.py"].size == 10
+    assert by_name["one.py"].modified is not None
+    assert by_name["deep"].size is None
+
+    bare = await tool.run(
+        ListDirArgs(path="Alpha/one", show_size=False, show_modified=False)
+    )
+    assert [(e.size, e.modified) for e in bare.entries] == [(None, None)] * 2
+
+
+@pytest.mark.asyncio
+async def test_read_ahead_is_bounded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for i in range(50):
+        (tmp_path / f"dir{i:02}").mkdir()
+        (tmp_path / f"dir{i:02}" / "file.txt").write_text("x")
+    submitted: list[str] = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, /, *args, **kwargs):
+            submitted.append(args[0])
+            return super().submit(fn, *args, **kwargs)
+
+    monkeypatch.setattr(list_dir, "ThreadPoolExecutor", RecordingExecutor)
+    tool = _make_list_dir(tmp_path, max_entries=5, scan_workers=2)
+
+    result = await tool.run(ListDirArgs(recursive=True))
+
+    assert result.was_truncated
+    # The walk entered three directories; only the next two were read ahead
+    assert len(submitted) <= 3 + 2
+
+
+def test_scan_workers_must_be_positive(tmp_path: Path) -> None:
+    with pytest.raises(ValidationError):
+        ListDirConfig(workdir=tmp_path, scan_workers=0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("scan_workers", [1, 2])
+async def test_skipped_directories_do_not_stall_the_read_ahead(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, scan_workers: int
+) -> None:
+    root = _make_tree(tmp_path)
+    hidden = {"Alpha", "beta"}
+    # Paths read, and whether the read was submitted ahead
+    reads: list[tuple[str, bool]] = []
+    scan_sorted = list_dir._scan_sorted
+
+    def recording_scan(dir_path: str, prefetch_stat: bool = False):
+        reads.append((os.path.relpath(dir_path, root), prefetch_stat))
+        return scan_sorted(dir_path, prefetch_stat)
+
+    # Listed as files although the scan saw directories, so the walk skips
+    # directories that are queued or already being read
+    create_entry = ListDir._create_entry
+
+    def entry_hiding_dirs(self, path, *args, **kwargs):
+        entry = create_entry(self, path, *args, **kwargs)
+        if entry.name in hidden:
+            entry.is_dir = False
+        return entry
+
+    monkeypatch.setattr(list_dir, "_scan_sorted", recording_scan)
+    monkeypatch.setattr(ListDir, "_create_entry", entry_hiding_dirs)
+    tool = _make_list_dir(root, scan_workers=scan_workers)
+
+    result = await tool.run(ListDirArgs(recursive=True))
+
+    listed = _listed(result)
+    assert ("Alpha/one", True) not in listed
+    assert ("gamma/one/deep/file.txt", False) in listed
+    entered = [path for path, _ in reads if path.split(os.sep)[0] not in hidden]
+    assert len(entered) == len(set(entered))
+    # Past the skipped directories, subdirectories are still read ahead
+    assert (os.path.join("gamma", "one", "deep"), True) in reads
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from vibe.core.tools.builtins import notebook_edit
+from vibe.core.tools.builtins.notebook_edit import (
+    NotebookEdit,
+    NotebookEditArgs,
+    NotebookEditConfig,
+    NotebookEditState,
+)
+
+
+def _make_notebook_edit(tmp_path: Path, **config) -> NotebookEdit:
+    return NotebookEdit(
+        config=NotebookEditConfig(workdir=tmp_path, **config), state=NotebookEditState()
+    )
+
+
+@pytest.fixture
+def notebook(tmp_path: Path) -> Path:
+    path = tmp_path / "nb.ipynb"
+    path.write_text(
+        json.dumps({
+            "cells": [
+                {
+                    "cell_type": "code",
+                    "metadata": {},
+                    "source": ["x = 1\n", "print(x)"],
+                    "execution_count": 1,
+                    "outputs": [],
+                }
+            ],
+            "metadata": {},
+            "nbformat": 4,
+            "nbformat_minor": 5,
+        })
+    )
+    return path
+
+
+def _cells(path: Path) -> list[dict]:
+    return json.loads(path.read_text())["cells"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("source", "lines"),
+    [
+        ("", []),
+        ("a", ["a"]),
+        ("a\nb", ["a\n", "b"]),
+        ("a\nb\n", ["a\n", "b\n"]),
+        ("\n\n", ["\n", "\n"]),
+        ("a\r\nb", ["a\r\n", "b"]),
+        ("a\rb\x0cc\u2028d\x85e", ["a\rb\x0cc\u2028d\x85e"]),
+    ],
+)
+async def test_replace_stores_nbformat_lines(
+    tmp_path: Path, notebook: Path, source: str, lines: list[str]
+) -> None:
+    tool = _make_notebook_edit(tmp_path)
+
+    await tool.run(NotebookEditArgs(path="nb.ipynb", cell_index=0, source=source))
+
+    cell = _cells(notebook)[0]
+    assert cell["source"] == lines
+    assert "".join(cell["source"]) == source
+    assert cell["execution_count"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("source", "lines"),
+    [
+        ("", []),
+        ("# Title\n", ["# Title\n"]),
+        ("# Title\n\ntext", ["# Title\n", "\n", "text"]),
+    ],
+)
+async def test_insert_stores_nbformat_lines(
+    tmp_path: Path, notebook: Path, source: str, lines: list[str]
+) -> None:
+    tool = _make_notebook_edit(tmp_path)
+
+    result = await tool.run(
+        NotebookEditArgs(
+            path="nb.ipynb",
+            cell_index=0,
+            mode="insert",
+            cell_type="markdown",
+            source=source,
+        )
+    )
+
+    cells = _cells(notebook)
+    assert result.total_cells == len(cells) == 2
+    assert cells[0] == {"cell_type": "markdown", "metadata": {}, "source": lines}
+    assert cells[1]["source"] == ["x = 1\n", "print(x)"]
+
+
+@pytest.mark.asyncio
+async def test_insert_creates_a_missing_notebook(tmp_path: Path) -> None:
+    tool = _make_notebook_edit(tmp_path)
+
+    await tool.run(
+        NotebookEditArgs(
+            path="new.ipynb",
+            cell_index=0,
+            mode="insert",
+            cell_type="code",
+            source="1\n",
+        )
+    )
+
+    cells = _cells(tmp_path / "new.ipynb")
+    assert cells == [
+        {
+            "cell_type": "code",
+            "metadata": {},
+            "source": ["1\n"],
+            "execution_count": None,
+            "outputs": [],
+        }
+    ]
+    assert not (tmp_path / "new.ipynb.backup").exists()
+
+
+@pytest.mark.asyncio
+async def test_delete_removes_the_cell(tmp_path: Path, notebook: Path) -> None:
+    tool = _make_notebook_edit(tmp_path)
+
+    result = await tool.run(
+        NotebookEditArgs(path="nb.ipynb", cell_index=0, mode="delete")
+    )
+
+    assert result.source_preview == "x = 1\nprint(x)"
+    assert _cells(notebook) == []
+
+
+@pytest.mark.asyncio
+async def test_backup_keeps_the_contents_before_each_edit(
+    tmp_path: Path, notebook: Path
+) -> None:
+    tool = _make_notebook_edit(tmp_path)
+    backup = tmp_path / "nb.ipynb.backup"
+    original = notebook.read_bytes()
+
+    await tool.run(NotebookEditArgs(path="nb.ipynb", cell_index=0, source="first"))
+    assert backup.read_bytes() == original
+    after_first = notebook.read_bytes()
+    assert after_first != original
+
+    await tool.run(NotebookEditArgs(path="nb.ipynb", cell_index=0, source="second"))
+    assert backup.read_bytes() == after_first
+    assert _cells(notebook)[0]["source"] == ["second"]
+
+
+@pytest.mark.asyncio
+async def test_backup_is_copied_when_links_fail(
+    tmp_path: Path, notebook: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def no_link(*args, **kwargs):
+        raise OSError("links not supported")
+
+    monkeypatch.setattr(notebook_edit.os, "link", no_link)
+    tool = _make_notebook_edit(tmp_path)
+    original = notebook.read_bytes()
+
+    await tool.run(NotebookEditArgs(path="nb.ipynb", cell_index=0, source="new"))
+
+    assert (tmp_path / "nb.ipynb.backup").read_bytes() == original
+
+
+@pytest.mark.asyncio
+async def test_failed_write_leaves_the_notebook_intact(
+    tmp_path: Path, notebook: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail_replace(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(notebook_edit.os, "replace", fail_replace)
+    tool = _make_notebook_edit(tmp_path)
+    original = notebook.read_bytes()
+
+    with pytest.raises(OSError, match="disk full"):
+        await tool.run(NotebookEditArgs(path="nb.ipynb", cell_index=0, source="new"))
+
+    assert notebook.read_bytes() == original
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["nb.ipynb", "nb.ipynb.backup"]
@@ -35,5 +35,6 @@ TRUSTED_FOLDERS_FILE = GlobalPath(lambda: VIBE_HOME.path / "trusted_folders.toml
 LOG_DIR = GlobalPath(lambda: VIBE_HOME.path / "logs")
 LOG_FILE = GlobalPath(lambda: VIBE_HOME.path / "vibe.log")
 ERROR_LOG_FILE = GlobalPath(lambda: VIBE_HOME.path / "logs" / "errors.log")
+DEPS_CACHE_FILE = GlobalPath(lambda: VIBE_HOME.path / "cache" / "deps.sqlite")
 
 DEFAULT_TOOL_DIR = GlobalPath(lambda: VIBE_ROOT / "core" / "tools" / "builtins")
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -18,8 +18,8 @@ if TYPE_CHECKING:
 def walk_tree(node: Node) -> Generator[Node, None, None]:
     """Walk all nodes in a tree depth-first.
 
-    Uses an iterative approach with a stack to avoid the overhead
-    of creating a new generator frame for every node.
+    Drives a tree-sitter cursor instead of reading ``node.children``, which
+    would build a Python list of child wrappers for every visited node.
 
     Args:
         node: Starting node
@@ -27,27 +27,33 @@ def walk_tree(node: Node) -> Generator[Node, None, None]:
     Yields:
         Each node in depth-first order
     """
-    stack = [node]
-    while stack:
-        current = stack.pop()
-        yield current
-        # Add children in reverse order so leftmost child is processed first
-        stack.extend(reversed(current.children))
+    cursor = node.walk()
+    while True:
+        yield cursor.node
+        if cursor.goto_first_child():
+            continue
+        # Climb until a sibling is found; the cursor cannot leave the
+        # subtree it was created on, so failing at the top ends the walk
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return
 
 
 def find_nodes_by_type(
-    tree: Tree, node_types: list[str]
+    tree: Tree, node_types: Iterable[str]
 ) -> Generator[Node, None, None]:
     """Find all nodes of specified types in a tree.
 
     Args:
         tree: Tree-sitter Tree
-        node_types: List of node type strings to match
+        node_types: Node type strings to match
 
     Yields:
         Matching nodes
     """
-    type_set = set(node_types)
+    type_set = (
+        node_types if isinstance(node_types, frozenset) else frozenset(node_types)
+    )
     for node in walk_tree(tree.root_node):
         if node.type in type_set:
             yield node
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 import re
+import textwrap
 from collections import deque
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from tree_sitter import Node
 
+_WHITESPACE = b" \t\r\n\f"
+_BACKSLASH = ord("\\")
+# Any valid Python string prefix, such as r, b, f, rb or Br
+_STRING_PREFIX_RE = re.compile(rb"[rRuUbBfF]{0,2}")
+_JSDOC_TAG_RE = re.compile(r"@(\w+)\s*(.*)")
+
 
 class DocstringExtractor:
     """Extract documentation comments for symbols."""
@@ -69,6 +76,22 @@ class DocstringExtractor:
     def __init__(self, language: str):
         self.language = language
         self.patterns = self.DOC_PATTERNS.get(language, {})
+        self._doc_prefixes = tuple(
+            prefix
+            for prefix in (
+                self.patterns.get("comment_prefix", ""),
+                self.patterns.get("alt_prefix", ""),
+            )
+            if prefix
+        )
+        # Doc prefixes are ASCII, so they can be matched on the raw source
+        # bytes before paying for a UTF-8 decode
+        self._doc_prefixes_b = tuple(
+            prefix.encode("ascii") for prefix in self._doc_prefixes
+        )
+        self._block_prefix_b = self.patterns.get(
+            "block_comment_prefix", "/**"
+        ).encode("ascii")
 
     def extract_docstring(self, node: Node, source: bytes) -> str | None:
         """Extract docstring/doc comment for a definition node.
@@ -92,58 +115,43 @@ class DocstringExtractor:
         if not body:
             return None
 
-        # First child of body should be expression_statement with string
-        if body.children:
-            first_stmt = body.children[0]
-            if first_stmt.type == "expression_statement":
-                for child in first_stmt.children:
-                    if child.type == "string":
-                        docstring = source[child.start_byte : child.end_byte].decode(
-                            "utf-8", errors="replace"
-                        )
-                        return self._clean_docstring(docstring)
+        # The docstring, if any, is the string literal the body starts with,
+        # so it can be located on the raw bytes without walking the children
+        span = _scan_docstring_bytes(source, body.start_byte, body.end_byte)
+        if span is None:
+            return None
 
-        return None
+        docstring = source[span[0] : span[1]].decode("utf-8", errors="replace")
+        return self._clean_docstring(docstring)
 
     def _extract_comment_docstring(self, node: Node, source: bytes) -> str | None:
         """Extract doc comment preceding a definition."""
         # Look for comments immediately before the node
         prev_sibling = node.prev_sibling
-        comments = deque()
+        comment_ranges: deque[tuple[int, int]] = deque()
 
         # Scan backwards for doc comments
         while prev_sibling:
             # Check for line comments
-            if prev_sibling.type in self.patterns.get("comment_types", ()):
-                text = source[prev_sibling.start_byte : prev_sibling.end_byte].decode(
-                    "utf-8", errors="replace"
+            if (
+                prev_sibling.type in self.patterns.get("comment_types", ())
+                and self._doc_prefixes_b
+                and self._has_prefix(source, prev_sibling, self._doc_prefixes_b)
+            ):
+                comment_ranges.appendleft(
+                    (prev_sibling.start_byte, prev_sibling.end_byte)
                 )
-
-                prefix = self.patterns.get("comment_prefix", "")
-                alt_prefix = self.patterns.get("alt_prefix", "")
-
-                # Check if it's a doc comment
-                stripped = text.strip()
-                is_doc_comment = False
-
-                if prefix and stripped.startswith(prefix):
-                    is_doc_comment = True
-                elif alt_prefix and stripped.startswith(alt_prefix):
-                    is_doc_comment = True
-
-                if is_doc_comment:
-                    comments.appendleft(text)
-                    prev_sibling = prev_sibling.prev_sibling
-                    continue
+                prev_sibling = prev_sibling.prev_sibling
+                continue
 
             # Check for block comments
-            if prev_sibling.type in self.patterns.get("block_comment_types", ()):
+            if prev_sibling.type in self.patterns.get(
+                "block_comment_types", ()
+            ) and self._has_prefix(source, prev_sibling, (self._block_prefix_b,)):
                 text = source[prev_sibling.start_byte : prev_sibling.end_byte].decode(
                     "utf-8", errors="replace"
                 )
-                block_prefix = self.patterns.get("block_comment_prefix", "/**")
-                if text.strip().startswith(block_prefix):
-                    return self._clean_block_comment(text)
+                return self._clean_block_comment(text)
 
             # Stop if we encounter a non-comment node (but skip whitespace)
             if prev_sibling.type not in ("comment", "line_comment", "block_comment"):
@@ -151,11 +159,38 @@ class DocstringExtractor:
 
             prev_sibling = prev_sibling.prev_sibling
 
-        if comments:
-            return self._clean_line_comments(list(comments))
+        if comment_ranges:
+            return self._clean_line_comments(
+                self._decode_comment_run(list(comment_ranges), source)
+            )
 
         return None
 
+    @staticmethod
+    def _has_prefix(source: bytes, node: Node, prefixes: tuple[bytes, ...]) -> bool:
+        """Check a comment's prefix on raw bytes, skipping leading whitespace."""
+        head = source[node.start_byte : min(node.end_byte, node.start_byte + 16)]
+        return head.lstrip().startswith(prefixes)
+
+    def _decode_comment_run(
+        self, ranges: list[tuple[int, int]], source: bytes
+    ) -> list[str]:
+        """Decode a run of adjacent comments with a single decode call.
+
+        Only whitespace separates sibling comments, so decoding the whole span
+        and dropping blank lines yields one line per comment. Multi-line
+        comments break that correspondence and are decoded one by one.
+        """
+        span = source[ranges[0][0] : ranges[-1][1]].decode("utf-8", errors="replace")
+        lines = [line for line in span.splitlines() if line.strip()]
+        if len(lines) == len(ranges):
+            return lines
+
+        return [
+            source[start:end].decode("utf-8", errors="replace")
+            for start, end in ranges
+        ]
+
     def _clean_docstring(self, docstring: str) -> str:
         """Clean Python docstring."""
         # Remove quotes
@@ -165,27 +200,9 @@ class DocstringExtractor:
         elif docstring.startswith('"') or docstring.startswith("'"):
             docstring = docstring[1:-1]
 
-        # Dedent
-        lines = docstring.split("\n")
-        if len(lines) > 1:
-            # Find minimum indentation (skip first line)
-            min_indent = float("inf")
-            for line in lines[1:]:
-                stripped = line.lstrip()
-                if stripped:
-                    indent = len(line) - len(stripped)
-                    min_indent = min(min_indent, indent)
-
-            if min_indent < float("inf"):
-                dedented = [lines[0]]
-                for line in lines[1:]:
-                    if len(line) > min_indent:
-                        dedented.append(line[min_indent:])
-                    else:
-                        dedented.append(line)
-                lines = dedented
-
-        return "\n".join(lines).strip()
+        # Dedent everything after the first line, which carries no indent
+        first, _, rest = docstring.partition("\n")
+        return (first + ("\n" + textwrap.dedent(rest) if rest else "")).strip()
 
     def _clean_block_comment(self, comment: str) -> str:
         """Clean JSDoc/JavaDoc style block comment."""
@@ -200,34 +217,20 @@ class DocstringExtractor:
             comment = comment[:-2]
 
         # Remove leading * from each line
-        lines = []
-        for line in comment.split("\n"):
-            stripped = line.strip()
-            if stripped.startswith("*"):
-                stripped = stripped[1:].lstrip()
-            lines.append(stripped)
-
-        return "\n".join(lines).strip()
+        return "\n".join(
+            line.strip().removeprefix("*").lstrip() for line in comment.split("\n")
+        ).strip()
 
     def _clean_line_comments(self, comments: list[str]) -> str:
         """Clean consecutive line comments."""
         lines = []
         for comment in comments:
             comment = comment.strip()
-
             # Remove comment prefix
-            prefix = self.patterns.get("comment_prefix", "")
-            alt_prefix = self.patterns.get("alt_prefix", "")
-
-            if prefix and comment.startswith(prefix):
-                # For /// or //, remove and strip
-                if prefix in ("///", "//"):
-                    comment = comment[len(prefix) :].strip()
-                else:
+            for prefix in self._doc_prefixes:
+                if comment.startswith(prefix):
                     comment = comment[len(prefix) :].lstrip()
-            elif alt_prefix and comment.startswith(alt_prefix):
-                comment = comment[len(alt_prefix) :].strip()
-
+                    break
             lines.append(comment)
 
         return "\n".join(lines).strip()
@@ -247,8 +250,7 @@ class DocstringExtractor:
 
         for line in docstring.split("\n"):
             # Check for @tag
-            match = re.match(r"@(\w+)\s*(.*)", line.strip())
-            if match:
+            if match := _JSDOC_TAG_RE.match(line.strip()):
                 # Save previous tag
                 if current_tag:
                     tags.setdefault(current_tag, []).append(
@@ -269,6 +271,63 @@ class DocstringExtractor:
         return tags
 
 
+def _scan_docstring_bytes(
+    source: bytes, start: int, end: int
+) -> tuple[int, int] | None:
+    """Locate a string literal statement at the start of a Python block.
+
+    Args:
+        source: Source code bytes
+        start: Byte offset where the block starts
+        end: Byte offset where the block ends
+
+    Returns:
+        (start, end) byte offsets of the quoted literal, or None if the block
+        does not open with a docstring
+    """
+    pos = start
+    while pos < end and source[pos] in _WHITESPACE:
+        pos += 1
+
+    # Skip string prefixes such as r"""...""" or b"..."; a name that only
+    # starts like one is rejected below, as no quote follows it
+    match = _STRING_PREFIX_RE.match(source, pos, end)
+    assert match is not None  # The pattern matches the empty string
+    pos = match.end()
+
+    if source.startswith((b'"""', b"'''"), pos):
+        quote = source[pos : pos + 3]
+    elif source.startswith((b'"', b"'"), pos):
+        quote = source[pos : pos + 1]
+    else:
+        return None
+
+    search = pos + len(quote)
+    while True:
+        close = source.find(quote, search, end)
+        if close < 0:
+            return None
+        escapes = 0
+        while source[close - 1 - escapes] == _BACKSLASH:
+            escapes += 1
+        if escapes % 2 == 0:
+            break
+        search = close + 1
+
+    if len(quote) == 1 and source.find(b"\n", pos, close) >= 0:
+        return None
+
+    literal_end = close + len(quote)
+    # The literal must be the whole statement, not e.g. "sep".join(items)
+    tail = literal_end
+    while tail < end and source[tail] in b" \t":
+        tail += 1
+    if tail < end and source[tail] not in b"\r\n#;":
+        return None
+
+    return pos, literal_end
+
+
 def extract_docstring(node: Node, language: str, source: bytes) -> str | None:
     """Convenience function to extract docstring for a node.
 
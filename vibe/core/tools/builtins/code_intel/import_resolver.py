@@ -1,11 +1,33 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    # Native JSON parser, used for reading package manifests when installed
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:
+    orjson = None
+
+_JSONC_RE = re.compile(
+    r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|//[^\n]*|/\*[\s\S]*?\*/'
+)
+_TRAILING_COMMA_RE = re.compile(r",(\s*[}\]])")
+_SIMPLE_WORKSPACE_GLOB_RE = re.compile(r"^([^*]+)/\*$")
+
+# Conditional export keys in resolution priority order
+_EXPORT_CONDITIONS = ("import", "require", "default", "types")
+_NESTED_EXPORT_CONDITIONS = ("default", "import", "require")
+
+# Extensions and index files tried when resolving a JS/TS import target
+_RESOLVE_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs", ".json")
+_INDEX_FILES = ("index.ts", "index.tsx", "index.js", "index.jsx", "index.mjs")
+
 
 @dataclass
 class ResolverConfig:
@@ -19,12 +41,67 @@ class ResolverConfig:
     workspaces: list[Path] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class PackageEntry:
+    """The package.json fields used during import resolution."""
+
+    name: str
+    entry: str
+    exports: Any = None
+
+
+def _load_manifest(data: bytes) -> Any:
+    """Parse package.json content, with orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Fall back so the standard parser decides what is malformed
+            pass
+    return json.loads(data)
+
+
+@lru_cache(maxsize=512)
+def _read_pkg_entry(path_str: str, mtime_ns: int) -> PackageEntry | None:
+    """Parse a package.json once per path and modification time.
+
+    Keying on mtime keeps the process-wide cache correct when a manifest is
+    edited between resolutions.
+    """
+    try:
+        with open(path_str, "rb") as f:
+            pkg = _load_manifest(f.read())
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+        return None
+
+    if not isinstance(pkg, dict):
+        return None
+
+    return PackageEntry(
+        name=pkg.get("name", ""),
+        entry=pkg.get("module") or pkg.get("main") or "index.js",
+        exports=pkg.get("exports"),
+    )
+
+
 class ImportResolver:
     """Enhanced import resolution for JS/TS ecosystem and other languages."""
 
     def __init__(self, project_root: Path):
         self.project_root = project_root.resolve()
+        self._nm_chain: dict[Path, list[str]] = {}
         self.config = self._load_config()
+        # Candidate paths on the resolution hot path are built as plain
+        # strings; Path objects are only created for the final result
+        self._project_root_s = str(self.project_root)
+        self._base_url_s = str(self.config.base_url or self.project_root)
+        # Without tsconfig paths, exports or workspaces those stages can
+        # never match, so resolve skips them
+        self._has_aliases = bool(
+            self.config.tsconfig_paths
+            or self.config.package_exports
+            or self.config.workspaces
+        )
 
     def _load_config(self) -> ResolverConfig:
         """Load configuration from tsconfig.json, package.json, etc."""
@@ -57,9 +134,7 @@ class ImportResolver:
                 for ws in workspaces:
                     # Expand globs
                     if "*" in ws:
-                        for path in self.project_root.glob(ws):
-                            if path.is_dir():
-                                config.workspaces.append(path)
+                        config.workspaces.extend(self._expand_workspace_glob(ws))
                     else:
                         ws_path = self.project_root / ws
                         if ws_path.is_dir():
@@ -75,73 +150,66 @@ class ImportResolver:
 
         return config
 
+    def _expand_workspace_glob(self, pattern: str) -> list[Path]:
+        """Expand a workspace glob into the package directories it matches."""
+        # "packages/*" is by far the most common form; scandir answers
+        # is_dir() from the directory listing without a stat per entry
+        if match := _SIMPLE_WORKSPACE_GLOB_RE.match(pattern):
+            base = self.project_root / match.group(1)
+            try:
+                with os.scandir(base) as entries:
+                    return sorted(
+                        Path(entry.path)
+                        for entry in entries
+                        if entry.is_dir()
+                    )
+            except OSError:
+                return []
+
+        return [path for path in self.project_root.glob(pattern) if path.is_dir()]
+
     def _load_json_with_comments(self, path: Path) -> dict[str, Any]:
         """Load JSON file, stripping comments (for tsconfig.json)."""
         content = path.read_text()
-        # Remove single-line comments
-        lines = []
-        for line in content.split("\n"):
-            stripped = line.lstrip()
-            if not stripped.startswith("//"):
-                # Remove inline comments (simple approach)
-                # Be careful not to remove // inside strings
-                comment_idx = self._find_comment_start(line)
-                if comment_idx > -1:
-                    line = line[:comment_idx]
-                lines.append(line)
-
+        # Strip // and /* */ comments, leaving string literals untouched
+        cleaned = _JSONC_RE.sub(
+            lambda m: m.group(0) if m.group(0).startswith(('"', "'")) else "",
+            content,
+        )
         # Remove trailing commas (common in tsconfig)
-        cleaned = "\n".join(lines)
-        cleaned = re.sub(r",(\s*[}\]])", r"\1", cleaned)
+        cleaned = _TRAILING_COMMA_RE.sub(r"\1", cleaned)
 
         return json.loads(cleaned)
 
-    def _find_comment_start(self, line: str) -> int:
-        """Find the start of a // comment outside of strings."""
-        in_string = False
-        string_char = None
-        i = 0
-        while i < len(line) - 1:
-            char = line[i]
-            if in_string:
-                if char == "\\" and i + 1 < len(line):
-                    i += 2  # Skip escaped char
-                    continue
-                if char == string_char:
-                    in_string = False
-            else:
-                if char in ('"', "'"):
-                    in_string = True
-                    string_char = char
-                elif char == "/" and line[i + 1] == "/":
-                    return i
-            i += 1
-        return -1
-
     def _parse_exports(self, exports: dict | str) -> dict[str, str]:
         """Parse package.json exports field."""
-        result: dict[str, str] = {}
-
         if isinstance(exports, str):
-            result["."] = exports
-        elif isinstance(exports, dict):
-            for key, value in exports.items():
-                if isinstance(value, str):
-                    result[key] = value
-                elif isinstance(value, dict):
-                    # Handle conditional exports
-                    for condition in ("import", "require", "default", "types"):
-                        if condition in value:
-                            cond_value = value[condition]
-                            if isinstance(cond_value, str):
-                                result[key] = cond_value
-                                break
-                            elif isinstance(cond_value, dict):
-                                # Nested conditional
-                                for nested_cond in ("default", "import", "require"):
-                                    if nested_cond in cond_value:
-                                        result[key] = cond_value[nested_cond]
-                                        break
+            return {".": exports}
+        if not isinstance(exports, dict):
+            return {}
+
+        result: dict[str, str] = {}
+        for key, value in exports.items():
+            if isinstance(value, str):
+                result[key] = value
+                continue
+            if not isinstance(value, dict):
+                continue
+
+            # Handle conditional exports, taking the highest-priority condition
+            condition = next((c for c in _EXPORT_CONDITIONS if c in value), None)
+            if condition is None:
+                continue
+            cond_value = value[condition]
+            if isinstance(cond_value, str):
+                result[key] = cond_value
+            elif isinstance(cond_value, dict):
+                # Nested conditional
+                nested = next(
+                    (c for c in _NESTED_EXPORT_CONDITIONS if c in cond_value), None
+                )
+                if nested is not None:
+                    result[key] = cond_value[nested]
 
         return result
 
@@ -159,20 +227,21 @@ class ImportResolver:
         if import_path.startswith("."):
             return self._resolve_relative(import_path, from_file)
 
-        # 2. Check tsconfig paths
-        resolved = self._resolve_tsconfig_path(import_path)
-        if resolved:
-            return resolved
+        if self._has_aliases:
+            # 2. Check tsconfig paths
+            resolved = self._resolve_tsconfig_path(import_path)
+            if resolved:
+                return resolved
 
-        # 3. Check package exports (for monorepo internal packages)
-        resolved = self._resolve_package_exports(import_path)
-        if resolved:
-            return resolved
+            # 3. Check package exports (for monorepo internal packages)
+            resolved = self._resolve_package_exports(import_path)
+            if resolved:
+                return resolved
 
-        # 4. Check workspaces
-        resolved = self._resolve_workspace(import_path)
-        if resolved:
-            return resolved
+            # 4. Check workspaces
+            resolved = self._resolve_workspace(import_path)
+            if resolved:
+                return resolved
 
         # 5. Check node_modules
         resolved = self._resolve_node_modules(import_path, from_file)
@@ -180,7 +249,9 @@ class ImportResolver:
             return resolved
 
         # 6. Try as absolute path from project root
-        resolved = self._try_resolve_path(self.project_root / import_path)
+        resolved = self._try_resolve_path_str(
+            os.path.join(self._project_root_s, import_path)
+        )
         if resolved:
             return resolved
 
@@ -189,13 +260,11 @@ class ImportResolver:
     def _resolve_relative(self, import_path: str, from_file: Path) -> Path | None:
         """Resolve a relative import."""
         base_dir = from_file.parent if from_file.is_file() else from_file
-        target = (base_dir / import_path).resolve()
-        return self._try_resolve_path(target)
+        target = os.path.realpath(os.path.join(base_dir, import_path))
+        return self._try_resolve_path_str(target)
 
     def _resolve_tsconfig_path(self, import_path: str) -> Path | None:
         """Resolve using tsconfig.json paths."""
-        base_url = self.config.base_url or self.project_root
-
         for pattern, targets in self.config.tsconfig_paths.items():
             # Check if pattern matches (simple wildcard support)
             if pattern.endswith("/*"):
@@ -205,14 +274,16 @@ class ImportResolver:
                     for target in targets:
                         if target.endswith("/*"):
                             target_base = target[:-2]
-                            resolved = self._try_resolve_path(
-                                base_url / target_base / remainder
+                            resolved = self._try_resolve_path_str(
+                                os.path.join(self._base_url_s, target_base, remainder)
                             )
                             if resolved:
                                 return resolved
             elif pattern == import_path:
                 for target in targets:
-                    resolved = self._try_resolve_path(base_url / target)
+                    resolved = self._try_resolve_path_str(
+                        os.path.join(self._base_url_s, target)
+                    )
                     if resolved:
                         return resolved
 
@@ -230,7 +301,9 @@ class ImportResolver:
 
                 if subpath in exports:
                     target = exports[subpath]
-                    resolved = self._try_resolve_path(self.project_root / target)
+                    resolved = self._try_resolve_path_str(
+                        os.path.join(self._project_root_s, target)
+                    )
                     if resolved:
                         return resolved
 
@@ -240,113 +313,113 @@ class ImportResolver:
         self, import_path: str, from_file: Path
     ) -> Path | None:
         """Resolve from node_modules."""
-        current = from_file.parent if from_file.is_file() else from_file
+        from_dir = from_file.parent if from_file.is_file() else from_file
+
+        # Check package.json main/module/types
+        parts = import_path.split("/")
+        if parts[0].startswith("@") and len(parts) > 1:
+            pkg_name = "/".join(parts[:2])
+            subpath = "/".join(parts[2:])
+        else:
+            pkg_name = parts[0]
+            subpath = "/".join(parts[1:])
+
+        for node_modules in self._node_modules_chain(from_dir):
+            resolved = self._try_resolve_path_str(
+                os.path.join(node_modules, import_path)
+            )
+            if resolved:
+                return resolved
+
+            pkg_dir = os.path.join(node_modules, pkg_name)
+            pkg = self._read_package_json(os.path.join(pkg_dir, "package.json"))
+            if pkg is None:
+                continue
+
+            resolved = self._try_resolve_path_str(
+                os.path.join(pkg_dir, subpath or pkg.entry)
+            )
+            if resolved:
+                return resolved
 
-        while current != current.parent:
-            node_modules = current / "node_modules"
-            if node_modules.is_dir():
-                resolved = self._try_resolve_path(node_modules / import_path)
-                if resolved:
-                    return resolved
+        return None
 
-                # Check package.json main/module/types
-                parts = import_path.split("/")
-                if parts[0].startswith("@") and len(parts) > 1:
-                    pkg_name = "/".join(parts[:2])
-                    subpath = "/".join(parts[2:])
-                else:
-                    pkg_name = parts[0]
-                    subpath = "/".join(parts[1:])
-
-                pkg_path = node_modules / pkg_name / "package.json"
-                if pkg_path.exists():
-                    try:
-                        pkg = json.loads(pkg_path.read_text())
-                        entry = (
-                            pkg.get("module") or pkg.get("main") or "index.js"
-                        )
-                        if subpath:
-                            resolved = self._try_resolve_path(
-                                node_modules / pkg_name / subpath
-                            )
-                        else:
-                            resolved = self._try_resolve_path(
-                                node_modules / pkg_name / entry
-                            )
-                        if resolved:
-                            return resolved
-                    except (json.JSONDecodeError, OSError):
-                        pass
+    def _node_modules_chain(self, from_dir: Path) -> list[str]:
+        """Return the node_modules directories visible from a directory.
 
+        The walk up to the filesystem root is done once per directory; every
+        later import from a file in that directory reuses the cached list.
+        """
+        if (chain := self._nm_chain.get(from_dir)) is not None:
+            return chain
+
+        chain = []
+        current = from_dir
+        while current != current.parent:
+            node_modules = os.path.join(current, "node_modules")
+            if os.path.isdir(node_modules):
+                chain.append(node_modules)
             current = current.parent
 
-        return None
+        self._nm_chain[from_dir] = chain
+        return chain
+
+    def _read_package_json(self, pkg_path: str) -> PackageEntry | None:
+        """Read a package.json's resolution fields, or None if unreadable."""
+        try:
+            mtime_ns = os.stat(pkg_path).st_mtime_ns
+        except OSError:
+            return None
+        return _read_pkg_entry(pkg_path, mtime_ns)
 
     def _resolve_workspace(self, import_path: str) -> Path | None:
         """Resolve from workspace packages."""
         for workspace in self.config.workspaces:
-            pkg_json = workspace / "package.json"
-            if pkg_json.exists():
-                try:
-                    pkg = json.loads(pkg_json.read_text())
-                    pkg_name = pkg.get("name", "")
-
-                    # Check if import matches package name
-                    if import_path == pkg_name:
-                        entry = pkg.get("module") or pkg.get("main") or "index.js"
-                        resolved = self._try_resolve_path(workspace / entry)
-                        if resolved:
-                            return resolved
-                    elif import_path.startswith(pkg_name + "/"):
-                        subpath = import_path[len(pkg_name) + 1 :]
-                        resolved = self._try_resolve_path(workspace / subpath)
-                        if resolved:
-                            return resolved
-
-                except (json.JSONDecodeError, OSError):
-                    pass
+            workspace_s = str(workspace)
+            pkg = self._read_package_json(os.path.join(workspace_s, "package.json"))
+            if pkg is None:
+                continue
+            pkg_name = pkg.name
+
+            # Check if import matches package name
+            if import_path == pkg_name:
+                resolved = self._try_resolve_path_str(
+                    os.path.join(workspace_s, pkg.entry)
+                )
+                if resolved:
+                    return resolved
+            elif import_path.startswith(pkg_name + "/"):
+                subpath = import_path[len(pkg_name) + 1 :]
+                resolved = self._try_resolve_path_str(
+                    os.path.join(workspace_s, subpath)
+                )
+                if resolved:
+                    return resolved
 
         return None
 
-    def _try_resolve_path(self, path: Path) -> Path | None:
-        """Try to resolve a path with various extensions."""
-        # Common extensions to try
-        extensions = [
-            "",  # Exact match
-            ".ts",
-            ".tsx",
-            ".js",
-            ".jsx",
-            ".mjs",
-            ".cjs",
-            ".json",
-        ]
-        index_files = [
-            "index.ts",
-            "index.tsx",
-            "index.js",
-            "index.jsx",
-            "index.mjs",
-        ]
-
-        # Try direct path with extensions
-        for ext in extensions:
-            candidate = path if not ext else path.with_suffix(ext)
-            if candidate.is_file():
-                return candidate
+    def _try_resolve_path_str(self, path: str) -> Path | None:
+        """Try to resolve a string path with various extensions."""
+        # Try direct path, then with its suffix swapped for each extension
+        if os.path.isfile(path):
+            return Path(path)
+        stem = os.path.splitext(path)[0]
+        for ext in _RESOLVE_EXTENSIONS:
+            if os.path.isfile(candidate := stem + ext):
+                return Path(candidate)
 
         # Try as directory with index file
-        if path.is_dir():
-            for index_file in index_files:
-                candidate = path / index_file
-                if candidate.is_file():
-                    return candidate
-
-        # Try adding extensions to the path
-        for ext in extensions[1:]:  # Skip empty extension
-            candidate = Path(str(path) + ext)
-            if candidate.is_file():
-                return candidate
+        if os.path.isdir(path):
+            for index_file in _INDEX_FILES:
+                if os.path.isfile(candidate := os.path.join(path, index_file)):
+                    return Path(candidate)
+
+        # Try adding extensions to the path (already covered above when the
+        # path has no suffix to swap)
+        if stem != path:
+            for ext in _RESOLVE_EXTENSIONS:
+                if os.path.isfile(candidate := path + ext):
+                    return Path(candidate)
 
         return None
 
@@ -1,84 +1,102 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from functools import lru_cache
+import os
 from pathlib import Path
+import re
+import sys
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
-@dataclass
+    from tree_sitter import Language
+
+
+def _node_types(*names: str) -> frozenset[str]:
+    """Build an interned node-type set for O(1) membership tests in AST walks."""
+    return frozenset(sys.intern(name) for name in names)
+
+
+@dataclass(slots=True)
 class LanguageConfig:
     """Configuration for a programming language's AST analysis."""
 
     name: str
-    extensions: list[str]
+    extensions: tuple[str, ...]
     # Node types that define symbols (functions, classes, variables)
-    definition_types: list[str]
+    definition_types: frozenset[str]
     # Node types that reference symbols
-    reference_types: list[str]
+    reference_types: frozenset[str]
     # Node types for import statements
-    import_types: list[str]
+    import_types: frozenset[str]
     # Tree-sitter language module name
     ts_module: str
     # Field names used to extract symbol names from definition nodes
-    name_fields: list[str] = field(default_factory=lambda: ["name"])
+    name_fields: tuple[str, ...] = ("name",)
     # Node types that contain function/method bodies
-    body_types: list[str] = field(default_factory=list)
+    body_types: frozenset[str] = frozenset()
+    # Module functions returning the grammar, tried in order
+    ts_language_fns: tuple[str, ...] = ("language",)
+    # Grammar loaded from ts_module, shared by every parser once imported
+    language: Language | None = field(default=None, compare=False, repr=False)
 
 
-LANGUAGE_CONFIG: dict[str, LanguageConfig] = {
+_LANGUAGE_CONFIG: dict[str, LanguageConfig] = {
     "python": LanguageConfig(
         name="python",
-        extensions=[".py", ".pyi"],
-        definition_types=[
+        extensions=(".py", ".pyi"),
+        definition_types=_node_types(
             "function_definition",
             "class_definition",
             "assignment",
             "augmented_assignment",
             "global_statement",
             "decorated_definition",
-        ],
-        reference_types=[
+        ),
+        reference_types=_node_types(
             "identifier",
             "attribute",
             "call",
-        ],
-        import_types=[
+        ),
+        import_types=_node_types(
             "import_statement",
             "import_from_statement",
-        ],
+        ),
         ts_module="tree_sitter_python",
-        name_fields=["name", "left"],
-        body_types=["block", "module"],
+        name_fields=("name", "left"),
+        body_types=_node_types("block", "module"),
     ),
     "javascript": LanguageConfig(
         name="javascript",
-        extensions=[".js", ".jsx", ".mjs", ".cjs"],
-        definition_types=[
+        extensions=(".js", ".jsx", ".mjs", ".cjs"),
+        definition_types=_node_types(
             "function_declaration",
             "class_declaration",
             "variable_declarator",
             "method_definition",
             "arrow_function",
             "function_expression",
-        ],
-        reference_types=[
+        ),
+        reference_types=_node_types(
             "identifier",
             "member_expression",
             "call_expression",
-        ],
-        import_types=[
+        ),
+        import_types=_node_types(
             "import_statement",
             "import_clause",
             "call_expression",  # for require()
-        ],
+        ),
         ts_module="tree_sitter_javascript",
-        name_fields=["name", "id"],
-        body_types=["statement_block", "program"],
+        name_fields=("name", "id"),
+        body_types=_node_types("statement_block", "program"),
     ),
     "typescript": LanguageConfig(
         name="typescript",
-        extensions=[".ts", ".tsx", ".mts", ".cts"],
-        definition_types=[
+        extensions=(".ts", ".tsx", ".mts", ".cts"),
+        definition_types=_node_types(
             "function_declaration",
             "class_declaration",
             "variable_declarator",
@@ -88,25 +106,26 @@ LANGUAGE_CONFIG: dict[str, LanguageConfig] = {
             "interface_declaration",
             "type_alias_declaration",
             "enum_declaration",
-        ],
-        reference_types=[
+        ),
+        reference_types=_node_types(
             "identifier",
             "member_expression",
             "call_expression",
             "type_identifier",
-        ],
-        import_types=[
+        ),
+        import_types=_node_types(
             "import_statement",
             "import_clause",
-        ],
+        ),
         ts_module="tree_sitter_typescript",
-        name_fields=["name", "id"],
-        body_types=["statement_block", "program"],
+        ts_language_fns=("language_typescript",),
+        name_fields=("name", "id"),
+        body_types=_node_types("statement_block", "program"),
     ),
     "go": LanguageConfig(
         name="go",
-        extensions=[".go"],
-        definition_types=[
+        extensions=(".go",),
+        definition_types=_node_types(
             "function_declaration",
             "method_declaration",
             "type_declaration",
@@ -114,25 +133,25 @@ LANGUAGE_CONFIG: dict[str, LanguageConfig] = {
             "var_declaration",
             "const_declaration",
             "short_var_declaration",
-        ],
-        reference_types=[
+        ),
+        reference_types=_node_types(
             "identifier",
             "selector_expression",
             "call_expression",
             "type_identifier",
-        ],
-        import_types=[
+        ),
+        import_types=_node_types(
             "import_declaration",
             "import_spec",
-        ],
+        ),
         ts_module="tree_sitter_go",
-        name_fields=["name"],
-        body_types=["block", "source_file"],
+        name_fields=("name",),
+        body_types=_node_types("block", "source_file"),
     ),
     "rust": LanguageConfig(
         name="rust",
-        extensions=[".rs"],
-        definition_types=[
+        extensions=(".rs",),
+        definition_types=_node_types(
             "function_item",
             "struct_item",
             "enum_item",
@@ -144,26 +163,26 @@ LANGUAGE_CONFIG: dict[str, LanguageConfig] = {
             "let_declaration",
             "mod_item",
             "macro_definition",
-        ],
-        reference_types=[
+        ),
+        reference_types=_node_types(
             "identifier",
             "field_expression",
             "call_expression",
             "type_identifier",
             "scoped_identifier",
-        ],
-        import_types=[
+        ),
+        import_types=_node_types(
             "use_declaration",
             "extern_crate_declaration",
-        ],
+        ),
         ts_module="tree_sitter_rust",
-        name_fields=["name"],
-        body_types=["block", "source_file"],
+        name_fields=("name",),
+        body_types=_node_types("block", "source_file"),
     ),
     "java": LanguageConfig(
         name="java",
-        extensions=[".java"],
-        definition_types=[
+        extensions=(".java",),
+        definition_types=_node_types(
             "class_declaration",
             "interface_declaration",
             "method_declaration",
@@ -171,48 +190,48 @@ LANGUAGE_CONFIG: dict[str, LanguageConfig] = {
             "enum_declaration",
             "annotation_type_declaration",
             "constructor_declaration",
-        ],
-        reference_types=[
+        ),
+        reference_types=_node_types(
             "identifier",
             "method_invocation",
             "field_access",
             "type_identifier",
-        ],
-        import_types=[
+        ),
+        import_types=_node_types(
             "import_declaration",
-        ],
+        ),
         ts_module="tree_sitter_java",
-        name_fields=["name"],
-        body_types=["block", "class_body", "program"],
+        name_fields=("name",),
+        body_types=_node_types("block", "class_body", "program"),
     ),
     "c": LanguageConfig(
         name="c",
-        extensions=[".c", ".h"],
-        definition_types=[
+        extensions=(".c", ".h"),
+        definition_types=_node_types(
             "function_definition",
             "declaration",
             "struct_specifier",
             "enum_specifier",
             "union_specifier",
             "type_definition",
-        ],
-        reference_types=[
+        ),
+        reference_types=_node_types(
             "identifier",
             "field_expression",
             "call_expression",
             "type_identifier",
-        ],
-        import_types=[
+        ),
+        import_types=_node_types(
             "preproc_include",
-        ],
+        ),
         ts_module="tree_sitter_c",
-        name_fields=["name", "declarator"],
-        body_types=["compound_statement", "translation_unit"],
+        name_fields=("name", "declarator"),
+        body_types=_node_types("compound_statement", "translation_unit"),
     ),
     "cpp": LanguageConfig(
         name="cpp",
-        extensions=[".cpp", ".cc", ".cxx", ".hpp", ".hh", ".hxx", ".h++"],
-        definition_types=[
+        extensions=(".cpp", ".cc", ".cxx", ".hpp", ".hh", ".hxx", ".h++"),
+        definition_types=_node_types(
             "function_definition",
             "class_specifier",
             "struct_specifier",
@@ -221,49 +240,51 @@ LANGUAGE_CONFIG: dict[str, LanguageConfig] = {
             "namespace_definition",
             "enum_specifier",
             "using_declaration",
-        ],
-        reference_types=[
+        ),
+        reference_types=_node_types(
             "identifier",
             "field_expression",
             "call_expression",
             "type_identifier",
             "qualified_identifier",
-        ],
-        import_types=[
+        ),
+        import_types=_node_types(
             "preproc_include",
             "using_declaration",
-        ],
+        ),
         ts_module="tree_sitter_cpp",
-        name_fields=["name", "declarator"],
-        body_types=["compound_statement", "translation_unit", "declaration_list"],
+        name_fields=("name", "declarator"),
+        body_types=_node_types(
+            "compound_statement", "translation_unit", "declaration_list"
+        ),
     ),
     "ruby": LanguageConfig(
         name="ruby",
-        extensions=[".rb", ".rake", ".gemspec"],
-        definition_types=[
+        extensions=(".rb", ".rake", ".gemspec"),
+        definition_types=_node_types(
             "method",
             "singleton_method",
             "class",
             "module",
             "assignment",
-        ],
-        reference_types=[
+        ),
+        reference_types=_node_types(
             "identifier",
             "call",
             "method_call",
             "constant",
-        ],
-        import_types=[
+        ),
+        import_types=_node_types(
             "call",  # require, require_relative are method calls
-        ],
+        ),
         ts_module="tree_sitter_ruby",
-        name_fields=["name"],
-        body_types=["body_statement", "program"],
+        name_fields=("name",),
+        body_types=_node_types("body_statement", "program"),
     ),
     "php": LanguageConfig(
         name="php",
-        extensions=[".php", ".phtml"],
-        definition_types=[
+        extensions=(".php", ".phtml"),
+        definition_types=_node_types(
             "function_definition",
             "class_declaration",
             "method_declaration",
@@ -271,28 +292,29 @@ LANGUAGE_CONFIG: dict[str, LanguageConfig] = {
             "trait_declaration",
             "enum_declaration",
             "property_declaration",
-        ],
-        reference_types=[
+        ),
+        reference_types=_node_types(
             "name",
             "member_access_expression",
             "function_call_expression",
             "class_constant_access_expression",
-        ],
-        import_types=[
+        ),
+        import_types=_node_types(
             "namespace_use_declaration",
             "require_expression",
             "require_once_expression",
             "include_expression",
             "include_once_expression",
-        ],
+        ),
         ts_module="tree_sitter_php",
-        name_fields=["name"],
-        body_types=["compound_statement", "program"],
+        ts_language_fns=("language_php",),
+        name_fields=("name",),
+        body_types=_node_types("compound_statement", "program"),
     ),
     "csharp": LanguageConfig(
         name="csharp",
-        extensions=[".cs"],
-        definition_types=[
+        extensions=(".cs",),
+        definition_types=_node_types(
             "class_declaration",
             "interface_declaration",
             "struct_declaration",
@@ -303,45 +325,48 @@ LANGUAGE_CONFIG: dict[str, LanguageConfig] = {
             "delegate_declaration",
             "constructor_declaration",
             "record_declaration",
-        ],
-        reference_types=[
+        ),
+        reference_types=_node_types(
             "identifier",
             "member_access_expression",
             "invocation_expression",
             "generic_name",
-        ],
-        import_types=[
+        ),
+        import_types=_node_types(
             "using_directive",
-        ],
+        ),
         ts_module="tree_sitter_c_sharp",
-        name_fields=["name"],
-        body_types=["block", "compilation_unit"],
+        ts_language_fns=("language_c_sharp", "language"),
+        name_fields=("name",),
+        body_types=_node_types("block", "compilation_unit"),
     ),
     "kotlin": LanguageConfig(
         name="kotlin",
-        extensions=[".kt", ".kts"],
-        definition_types=[
+        extensions=(".kt", ".kts"),
+        definition_types=_node_types(
             "class_declaration",
             "function_declaration",
             "property_declaration",
             "object_declaration",
             "type_alias",
             "companion_object",
-        ],
-        reference_types=[
+        ),
+        reference_types=_node_types(
             "simple_identifier",
             "call_expression",
             "navigation_expression",
             "type_identifier",
-        ],
-        import_types=[
+        ),
+        import_types=_node_types(
             "import_header",
-        ],
+        ),
         ts_module="tree_sitter_kotlin",
-        name_fields=["name"],
-        body_types=["function_body", "class_body", "source_file"],
+        name_fields=("name",),
+        body_types=_node_types("function_body", "class_body", "source_file"),
     ),
 }
+# Read-only view; configs are shared process-wide and must not be swapped out
+LANGUAGE_CONFIG: Mapping[str, LanguageConfig] = MappingProxyType(_LANGUAGE_CONFIG)
 
 # Extension to language mapping for quick lookup
 EXTENSION_TO_LANGUAGE: dict[str, str] = {}
@@ -349,11 +374,29 @@ for lang_name, config in LANGUAGE_CONFIG.items():
     for ext in config.extensions:
         EXTENSION_TO_LANGUAGE[ext] = lang_name
 
+SUPPORTED_EXTENSIONS: tuple[str, ...] = tuple(EXTENSION_TO_LANGUAGE)
+SUPPORTED_EXTENSIONS_SET: frozenset[str] = frozenset(SUPPORTED_EXTENSIONS)
 
-@lru_cache(maxsize=1000)
-def _get_language_for_suffix(suffix: str) -> str | None:
-    """Cached language lookup by file suffix."""
-    return EXTENSION_TO_LANGUAGE.get(suffix.lower())
+# Matches a supported extension at the end of a path, so lookups run in the
+# regex engine without splitting the path or lowercasing it
+_SUPPORTED_SUFFIX_RE = re.compile(
+    r"\.(?:"
+    + "|".join(re.escape(ext[1:]) for ext in SUPPORTED_EXTENSIONS)
+    + r")\Z",
+    re.IGNORECASE,
+)
+
+
+def _supported_suffix(file_path: str | Path) -> str | None:
+    """Return the path's extension if it is a supported one."""
+    path = file_path if isinstance(file_path, str) else os.fspath(file_path)
+    if (match := _SUPPORTED_SUFFIX_RE.search(path)) is None:
+        return None
+    # A dotfile such as ".py" has no suffix
+    start = match.start()
+    if start == 0 or path[start - 1] in "/\\":
+        return None
+    return match.group()
 
 
 def get_language_for_file(file_path: str | Path) -> str | None:
@@ -364,20 +407,17 @@ def get_language_for_file(file_path: str | Path) -> str | None:
 
     Returns:
         Language name if recognized, None otherwise
-
-    Note:
-        Uses LRU cache internally to avoid repeated Path/suffix operations
-        for files with the same extension.
     """
-    path = Path(file_path) if isinstance(file_path, str) else file_path
-    return _get_language_for_suffix(path.suffix)
+    if (suffix := _supported_suffix(file_path)) is None:
+        return None
+    return EXTENSION_TO_LANGUAGE[suffix.lower()]
 
 
-def get_supported_extensions() -> list[str]:
-    """Get list of all supported file extensions."""
-    return list(EXTENSION_TO_LANGUAGE.keys())
+def get_supported_extensions() -> tuple[str, ...]:
+    """Get all supported file extensions."""
+    return SUPPORTED_EXTENSIONS
 
 
 def is_supported_file(file_path: str | Path) -> bool:
     """Check if a file is supported for code analysis."""
-    return get_language_for_file(file_path) is not None
+    return _supported_suffix(file_path) is not None
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 import importlib
 import os
 from pathlib import Path
+import sys
+import threading
 from typing import TYPE_CHECKING
 
 from vibe.core.tools.builtins.code_intel.languages import (
     LANGUAGE_CONFIG,
+    LanguageConfig,
     get_language_for_file,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Buffer, Iterable
+
     from tree_sitter import Language, Node, Parser, Tree
 
 
@@ -18,13 +26,40 @@ class TreeSitterNotAvailable(Exception):
     """Raised when tree-sitter is not available."""
 
 
+# Serializes grammar imports; loaded grammars live on their LanguageConfig
+_language_load_lock = threading.Lock()
+# Reverse lookup from a loaded grammar to its language name
+_language_names: dict[Language, str] = {}
+
+# Default memory budget for cached ASTs
+DEFAULT_AST_CACHE_BUDGET = 256 * 1024 * 1024
+
+
+@dataclass(slots=True)
+class _CachedTree:
+    """An AST cache entry."""
+
+    # (st_mtime_ns, st_size, st_ino) of the file when it was last seen
+    stamp: tuple[int, int, int]
+    # Source the tree was parsed from, kept for incremental reparsing
+    source: bytes
+    tree: Tree
+    # Estimated memory held by the tree (source plus parse state)
+    size: int
+
+
 class CodeParser:
     """Manages tree-sitter parsers with caching for performance."""
 
-    def __init__(self) -> None:
-        self._parsers: dict[str, Parser] = {}
-        self._languages: dict[str, Language] = {}
-        self._ast_cache: dict[str, tuple[float, Tree]] = {}
+    def __init__(self, ast_cache_budget: int = DEFAULT_AST_CACHE_BUDGET) -> None:
+        # tree-sitter parsers carry mutable parse state, so each thread gets
+        # its own set; Language objects are immutable and shared
+        self._parser_tls = threading.local()
+        # LRU of parsed trees by resolved path, bounded by estimated bytes
+        self._ast_cache: OrderedDict[str, _CachedTree] = OrderedDict()
+        self._ast_cache_bytes = 0
+        self._ast_cache_budget = ast_cache_budget
+        self._ast_cache_lock = threading.Lock()
         self._tree_sitter_available: bool | None = None
 
     def is_available(self) -> bool:
@@ -38,38 +73,53 @@ class CodeParser:
                 self._tree_sitter_available = False
         return self._tree_sitter_available
 
+    def preload_languages(self) -> None:
+        """Load every configured grammar, skipping unavailable ones.
+
+        Grammars are otherwise imported lazily on the first file of each
+        language. Callers about to scan a polyglot tree can run this in a
+        background thread to take the imports off the hot path.
+        """
+        for lang_name in LANGUAGE_CONFIG:
+            try:
+                self._get_language(lang_name)
+            except TreeSitterNotAvailable:
+                pass
+
     def _get_language(self, lang_name: str) -> Language:
         """Get or load a tree-sitter language."""
-        if lang_name in self._languages:
-            return self._languages[lang_name]
-
-        if lang_name not in LANGUAGE_CONFIG:
+        if (config := LANGUAGE_CONFIG.get(lang_name)) is None:
             raise ValueError(f"Unsupported language: {lang_name}")
+        if (lang := config.language) is not None:
+            return lang
 
-        config = LANGUAGE_CONFIG[lang_name]
+        with _language_load_lock:
+            if (lang := config.language) is not None:
+                return lang
+            return self._load_language(config)
 
+    def _load_language(self, config: LanguageConfig) -> Language:
+        """Import a tree-sitter language module. Caller holds the lock."""
+        lang_name = config.name
         try:
             # Import the language module dynamically
-            module = importlib.import_module(config.ts_module)
-
-            # Handle languages with special module structures
-            if lang_name == "typescript":
-                # TypeScript has language_typescript() function
-                lang = module.language_typescript()
-            elif lang_name == "php":
-                # PHP module has language_php() function
-                lang = module.language_php()
-            elif lang_name == "csharp":
-                # C# module may have language() or language_c_sharp()
-                if hasattr(module, "language_c_sharp"):
-                    lang = module.language_c_sharp()
-                else:
-                    lang = module.language()
-            else:
-                # Most modules have a language() function
-                lang = module.language()
-
-            self._languages[lang_name] = lang
+            module = sys.modules.get(config.ts_module) or importlib.import_module(
+                config.ts_module
+            )
+
+            # Grammar modules expose language() or a language-specific variant
+            loader_name = next(
+                (name for name in config.ts_language_fns if hasattr(module, name)),
+                config.ts_language_fns[-1],
+            )
+            from tree_sitter import Language
+
+            # Grammar packages return a raw capsule that Parser won't accept
+            # until it is wrapped
+            lang = Language(getattr(module, loader_name)())
+
+            _language_names[lang] = lang_name
+            config.language = lang
             return lang
 
         except ImportError as e:
@@ -82,9 +132,12 @@ class CodeParser:
             ) from e
 
     def _get_parser(self, lang_name: str) -> Parser:
-        """Get or create a parser for the given language."""
-        if lang_name in self._parsers:
-            return self._parsers[lang_name]
+        """Get or create this thread's parser for the given language."""
+        parsers: dict[str, Parser] | None = getattr(self._parser_tls, "parsers", None)
+        if parsers is None:
+            parsers = self._parser_tls.parsers = {}
+        if (parser := parsers.get(lang_name)) is not None:
+            return parser
 
         if not self.is_available():
             raise TreeSitterNotAvailable("tree-sitter is not installed")
@@ -93,13 +146,16 @@ class CodeParser:
 
         language = self._get_language(lang_name)
         parser = Parser(language)
-        self._parsers[lang_name] = parser
+        parsers[lang_name] = parser
         return parser
 
     def parse_file(self, file_path: str | Path) -> Tree | None:
         """Parse a file and return its AST.
 
-        Uses caching based on file modification time.
+        Uses caching based on the file's stat signature. When the file changed
+        but its content did not (e.g. a checkout or a no-op formatter run
+        touched the file), the cached tree is reused without reparsing. When
+        the content did change, the cached tree seeds an incremental reparse.
 
         Args:
             file_path: Path to the file to parse
@@ -107,62 +163,102 @@ class CodeParser:
         Returns:
             Tree-sitter Tree object, or None if parsing fails
         """
-        path = Path(file_path).resolve()
-        path_str = str(path)
+        path_str = os.path.abspath(
+            file_path if isinstance(file_path, str) else os.fspath(file_path)
+        )
 
         # Detect language
-        lang_name = get_language_for_file(path)
+        lang_name = get_language_for_file(path_str)
         if lang_name is None:
             return None
 
-        # Check cache
+        # Check cache; size and inode catch edits that preserve the mtime
         try:
-            mtime = os.path.getmtime(path)
+            st = os.stat(path_str)
         except OSError:
             return None
+        stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
 
-        if path_str in self._ast_cache:
-            cached_mtime, cached_tree = self._ast_cache[path_str]
-            if cached_mtime == mtime:
-                return cached_tree
+        with self._ast_cache_lock:
+            cached = self._ast_cache.get(path_str)
+            if cached is not None and cached.stamp == stamp:
+                self._ast_cache.move_to_end(path_str)
+                return cached.tree
 
-        # Parse file
+        # Parse file. Trees slice node text out of their source, so it is read
+        # into an owned buffer: with a memory map, an in-place edit would
+        # change old trees' text, and a truncation would fault the process
         try:
-            parser = self._get_parser(lang_name)
-            content = path.read_bytes()
-            tree = parser.parse(content)
+            with open(path_str, "rb", buffering=0) as f:
+                content = f.readall()
+            if cached is None:
+                tree = self._get_parser(lang_name).parse(content)
+            elif cached.source == content:
+                # Touched but unchanged; keep the tree under the new stamp
+                tree = cached.tree
+            else:
+                tree = self._reparse(content, lang_name, cached.tree, cached.source)
+        except (OSError, TreeSitterNotAvailable):
+            tree = None
+        else:
+            self._cache_tree(
+                path_str, _CachedTree(stamp, content, tree, len(content) * 3)
+            )
+        return tree
 
-            # Cache result
-            self._ast_cache[path_str] = (mtime, tree)
-            return tree
+    def parse_files(
+        self, file_paths: Iterable[str | Path]
+    ) -> dict[str | Path, Tree | None]:
+        """Parse several files concurrently.
 
-        except (OSError, TreeSitterNotAvailable):
-            return None
+        tree-sitter releases the GIL while parsing and each worker thread
+        gets its own parsers, so files are parsed in parallel.
+
+        Args:
+            file_paths: Paths of the files to parse
+
+        Returns:
+            Mapping of each given path to its Tree, or None if parsing failed
+        """
+        paths = list(file_paths)
+        if len(paths) <= 1:
+            return {path: self.parse_file(path) for path in paths}
 
-    def parse_string(self, content: str, language: str) -> Tree | None:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return dict(zip(paths, executor.map(self.parse_file, paths), strict=True))
+
+    def language_of(self, tree: Tree) -> str | None:
+        """Return the name of the language a tree was parsed as.
+
+        Lets callers that are handed a tree skip detecting the language from
+        the file path again.
+        """
+        return _language_names.get(tree.language)
+
+    def parse_string(self, content: str | bytes, language: str) -> Tree | None:
         """Parse a string of code.
 
         Args:
-            content: Source code string
+            content: Source code string, or already-encoded UTF-8 bytes
             language: Language name
 
         Returns:
             Tree-sitter Tree object, or None if parsing fails
         """
-        try:
-            parser = self._get_parser(language)
-            return parser.parse(content.encode("utf-8"))
-        except (TreeSitterNotAvailable, ValueError):
-            return None
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        return self.parse_bytes(content, language)
 
-    def parse_bytes(self, content: bytes, language: str) -> Tree | None:
+    def parse_bytes(self, content: Buffer, language: str) -> Tree | None:
         """Parse source code from bytes.
 
         This method allows callers to read file content once and use it for
         both parsing and subsequent analysis, avoiding duplicate file reads.
+        Any buffer is accepted, so a memoryview or an mmap of a large file is
+        parsed in place without copying it into a bytes object first.
 
         Args:
-            content: Source code as bytes
+            content: Source code as bytes or another buffer
             language: Language name
 
         Returns:
@@ -174,15 +270,108 @@ class CodeParser:
         except (TreeSitterNotAvailable, ValueError):
             return None
 
+    def reparse_bytes(
+        self, content: bytes, language: str, old_tree: Tree, old_content: bytes
+    ) -> Tree | None:
+        """Parse a new version of a source, reusing the tree of an older one.
+
+        tree-sitter only re-parses the region that differs between the two
+        versions, which is much cheaper than a full parse for small edits.
+        ``old_tree`` is not modified.
+
+        Args:
+            content: New source code as bytes
+            language: Language name
+            old_tree: Tree previously parsed from ``old_content``
+            old_content: Source code ``old_tree`` was parsed from
+
+        Returns:
+            Tree-sitter Tree object, or None if parsing fails
+        """
+        try:
+            return self._reparse(content, language, old_tree, old_content)
+        except (TreeSitterNotAvailable, ValueError):
+            return None
+
+    def _reparse(
+        self, content: bytes, language: str, old_tree: Tree, old_content: bytes
+    ) -> Tree:
+        parser = self._get_parser(language)
+        # Trees are shared with callers, so record the edit on a copy
+        tree = old_tree.copy()
+        _edit_tree(tree, old_content, content)
+        return parser.parse(content, tree)
+
+    def _cache_tree(self, path_str: str, entry: _CachedTree) -> None:
+        """Insert a tree, evicting least recently used ones over budget."""
+        with self._ast_cache_lock:
+            if (old := self._ast_cache.pop(path_str, None)) is not None:
+                self._ast_cache_bytes -= old.size
+            self._ast_cache[path_str] = entry
+            self._ast_cache_bytes += entry.size
+
+            while self._ast_cache_bytes > self._ast_cache_budget and self._ast_cache:
+                _, evicted = self._ast_cache.popitem(last=False)
+                self._ast_cache_bytes -= evicted.size
+
     def clear_cache(self) -> None:
         """Clear the AST cache."""
-        self._ast_cache.clear()
+        with self._ast_cache_lock:
+            self._ast_cache.clear()
+            self._ast_cache_bytes = 0
 
     def get_node_text(self, node: Node, source: bytes) -> str:
         """Extract the text of a node from source bytes."""
         return source[node.start_byte : node.end_byte].decode("utf-8", errors="replace")
 
 
+def _common_prefix_len(a: bytes, b: bytes, limit: int) -> int:
+    """Length of the common prefix of two byte strings, up to ``limit``."""
+    # Binary search so the comparisons run as memcmp rather than a byte loop
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix_len(a: bytes, b: bytes, limit: int) -> int:
+    """Length of the common suffix of two byte strings, up to ``limit``."""
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid :] == b[len(b) - mid :]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _point_at(source: bytes, offset: int) -> tuple[int, int]:
+    """Convert a byte offset into a tree-sitter (row, column) point."""
+    row = source.count(b"\n", 0, offset)
+    return row, offset - (source.rfind(b"\n", 0, offset) + 1)
+
+
+def _edit_tree(tree: Tree, old: bytes, new: bytes) -> None:
+    """Record the span that differs between two sources as a single edit."""
+    start = _common_prefix_len(old, new, min(len(old), len(new)))
+    tail = _common_suffix_len(old, new, min(len(old), len(new)) - start)
+    old_end = len(old) - tail
+    new_end = len(new) - tail
+    tree.edit(
+        start_byte=start,
+        old_end_byte=old_end,
+        new_end_byte=new_end,
+        start_point=_point_at(old, start),
+        old_end_point=_point_at(old, old_end),
+        new_end_point=_point_at(new, new_end),
+    )
+
+
 # Global parser instance for shared use
 _global_parser: CodeParser | None = None
 
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from enum import StrEnum, auto
+from enum import IntEnum, StrEnum, auto
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from tree_sitter import Node, Tree
 
 
-class ScopeType(StrEnum):
-    """Types of scopes in code."""
+class ScopeType(IntEnum):
+    """Types of scopes in code.
+
+    Int-valued because scope types are compared for every scope and symbol;
+    ``label`` is the lowercase name used in serialized output.
+    """
 
     GLOBAL = auto()  # Module/file level
     CLASS = auto()  # Class body
@@ -17,6 +21,20 @@ class ScopeType(StrEnum):
     BLOCK = auto()  # Block scope (if/for/while)
     NAMESPACE = auto()  # Namespace/package scope
 
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+# (is_global, is_class, is_function) for each scope type
+_SCOPE_FLAGS: dict[ScopeType, tuple[bool, bool, bool]] = {
+    ScopeType.GLOBAL: (True, False, False),
+    ScopeType.CLASS: (False, True, False),
+    ScopeType.FUNCTION: (False, False, True),
+    ScopeType.BLOCK: (False, False, False),
+    ScopeType.NAMESPACE: (False, False, False),
+}
+
 
 class SymbolKind(StrEnum):
     """Kinds of symbols."""
@@ -38,7 +56,7 @@ class SymbolKind(StrEnum):
     TRAIT = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Scope:
     """Represents a scope in code."""
 
@@ -50,9 +68,18 @@ class Scope:
     children: list[Scope] = field(default_factory=list)
     symbols: list[Symbol] = field(default_factory=list)
     node: Node | None = field(default=None, repr=False)
+    # Dotted names of this scope and the scopes enclosing it
+    qualified_prefix: str = field(init=False, default="", repr=False)
+
+    def __post_init__(self) -> None:
+        parent_prefix = self.parent.qualified_prefix if self.parent else ""
+        if self.name and parent_prefix:
+            self.qualified_prefix = f"{parent_prefix}.{self.name}"
+        else:
+            self.qualified_prefix = self.name or parent_prefix
 
 
-@dataclass
+@dataclass(slots=True)
 class Symbol:
     """Enhanced symbol with scope information."""
 
@@ -79,15 +106,8 @@ class Symbol:
     @property
     def qualified_name(self) -> str:
         """Get fully qualified name including scope."""
-        parts = []
-        current_scope = self.scope
-        while current_scope:
-            if current_scope.name:
-                parts.append(current_scope.name)
-            current_scope = current_scope.parent
-        parts.reverse()
-        parts.append(self.name)
-        return ".".join(parts)
+        prefix = self.scope.qualified_prefix if self.scope else ""
+        return f"{prefix}.{self.name}" if prefix else self.name
 
 
 # Node types that create new scopes, per language
@@ -215,25 +235,50 @@ class ScopeAnalyzer:
         return root
 
     def _build_scopes(self, node: Node, current_scope: Scope, source: bytes) -> None:
-        """Recursively build scopes."""
-        for child in node.children:
-            scope_type = self.scope_creators.get(child.type)
-
-            if scope_type:
-                # Create new scope
-                name = self._get_scope_name(child, source)
-                new_scope = Scope(
-                    type=scope_type,
-                    name=name,
-                    start_line=child.start_point[0] + 1,
-                    end_line=child.end_point[0] + 1,
-                    parent=current_scope,
-                    node=child,
-                )
-                current_scope.children.append(new_scope)
-                self._build_scopes(child, new_scope, source)
-            else:
-                self._build_scopes(child, current_scope, source)
+        """Build the scopes below a node.
+
+        Walks with a tree cursor instead of recursing over ``node.children``,
+        which would wrap every child of every node in a Python object. Scopes
+        opened on the cursor's current path are kept on a stack along with
+        the depth they were opened at, and are closed as the cursor leaves
+        that depth.
+        """
+        scope_creators = self.scope_creators
+        cursor = node.walk()
+        if not cursor.goto_first_child():
+            return
+
+        open_scopes: list[tuple[int, Scope]] = [(0, current_scope)]
+        depth = 1
+        while True:
+            child = cursor.node
+            # Tokens can't contain scopes; this also keeps keyword tokens that
+            # share a scope creator's type (Ruby's "class") from matching
+            if child.child_count:
+                if scope_type := scope_creators.get(child.type):
+                    parent = open_scopes[-1][1]
+                    new_scope = Scope(
+                        type=scope_type,
+                        name=self._get_scope_name(child, source),
+                        start_line=child.start_point[0] + 1,
+                        end_line=child.end_point[0] + 1,
+                        parent=parent,
+                        node=child,
+                    )
+                    parent.children.append(new_scope)
+                    open_scopes.append((depth, new_scope))
+                cursor.goto_first_child()
+                depth += 1
+                continue
+
+            while not cursor.goto_next_sibling():
+                cursor.goto_parent()
+                depth -= 1
+                if depth == 0:
+                    return
+            # Leaving the previous sibling closes the scopes opened within it
+            while open_scopes[-1][0] >= depth:
+                open_scopes.pop()
 
     def _get_scope_name(self, node: Node, source: bytes) -> str | None:
         """Extract name from a scope-creating node."""
@@ -263,17 +308,68 @@ class ScopeAnalyzer:
         Returns:
             The innermost scope containing the position
         """
+        # The innermost match is the last scope a pre-order search would
+        # reach, so descend into the last child containing the line
         best_scope = root
+        if not root.start_line <= line <= root.end_line:
+            return best_scope
+
+        while True:
+            for child in reversed(best_scope.children):
+                if child.start_line <= line <= child.end_line:
+                    best_scope = child
+                    break
+            else:
+                return best_scope
 
-        def search(scope: Scope) -> None:
-            nonlocal best_scope
-            if scope.start_line <= line <= scope.end_line:
-                best_scope = scope
-                for child in scope.children:
-                    search(child)
+    def find_scope_chain_at(
+        self, tree: Tree, source: bytes, line: int, column: int = 0
+    ) -> Scope:
+        """Find the innermost scope at a position without building the full tree.
 
-        search(root)
-        return best_scope
+        Descends straight to the node at the position and collects its
+        scope-creating ancestors, so only the scopes on that path are built.
+        A column inside the line's indentation is moved to its first
+        character, so a position on a ``def`` line lands in that function.
+
+        Args:
+            tree: Tree-sitter Tree
+            source: Source code bytes
+            line: Line number (1-indexed)
+            column: Column number (0-indexed)
+
+        Returns:
+            The innermost scope; its parents form the chain up to the root
+        """
+        root_node = tree.root_node
+        scope = Scope(
+            type=ScopeType.GLOBAL,
+            name=None,
+            start_line=1,
+            end_line=root_node.end_point[0] + 1,
+            node=root_node,
+        )
+
+        point = (line - 1, _skip_indent(source, line - 1, column))
+        node = root_node.descendant_for_point_range(point, point)
+        ancestors: list[tuple[ScopeType, Node]] = []
+        while node is not None and node.parent is not None:
+            if node.child_count and (scope_type := self.scope_creators.get(node.type)):
+                ancestors.append((scope_type, node))
+            node = node.parent
+
+        for scope_type, node in reversed(ancestors):
+            child = Scope(
+                type=scope_type,
+                name=self._get_scope_name(node, source),
+                start_line=node.start_point[0] + 1,
+                end_line=node.end_point[0] + 1,
+                parent=scope,
+                node=node,
+            )
+            scope.children.append(child)
+            scope = child
+        return scope
 
     def classify_symbol(
         self, node: Node, scope: Scope, source: bytes
@@ -323,39 +419,43 @@ class ScopeAnalyzer:
             if parent and parent.type == "attribute":
                 obj = parent.child_by_field_name("object")
                 if obj:
-                    obj_text = source[obj.start_byte : obj.end_byte].decode(
-                        "utf-8", errors="replace"
-                    )
-                    return obj_text == "self"
+                    # Compare raw bytes; decoding can't turn anything else into
+                    # an ASCII keyword
+                    return source[obj.start_byte : obj.end_byte] == b"self"
         elif self.language in ("javascript", "typescript", "java", "csharp", "kotlin"):
             parent = node.parent
             if parent and parent.type in ("member_expression", "field_access", "member_access_expression"):
                 obj = parent.child_by_field_name("object")
                 if obj:
-                    obj_text = source[obj.start_byte : obj.end_byte].decode(
-                        "utf-8", errors="replace"
-                    )
-                    return obj_text == "this"
+                    return source[obj.start_byte : obj.end_byte] == b"this"
         elif self.language == "php":
             parent = node.parent
             if parent and parent.type == "member_access_expression":
                 obj = parent.child_by_field_name("object")
                 if obj:
-                    obj_text = source[obj.start_byte : obj.end_byte].decode(
-                        "utf-8", errors="replace"
-                    )
-                    return obj_text in ("$this", "self")
+                    return source[obj.start_byte : obj.end_byte] in (b"$this", b"self")
         elif self.language == "ruby":
             # Ruby instance variables start with @
             if node.type == "instance_variable":
                 return True
-            node_text = source[node.start_byte : node.end_byte].decode(
-                "utf-8", errors="replace"
-            )
-            return node_text.startswith("@") and not node_text.startswith("@@")
+            # Only the first two bytes matter; skip copying the whole node
+            head = source[node.start_byte : min(node.end_byte, node.start_byte + 2)]
+            return head.startswith(b"@") and head != b"@@"
         return False
 
 
+def _skip_indent(source: bytes, row: int, column: int) -> int:
+    """Move a column that falls in a line's indentation to the first token."""
+    start = 0
+    for _ in range(row):
+        start = source.find(b"\n", start) + 1
+        if start == 0:
+            return column
+    end = source.find(b"\n", start)
+    text = source[start : end if end >= 0 else len(source)]
+    return max(column, len(text) - len(text.lstrip()))
+
+
 def get_scope_info(
     tree: Tree, language: str, source: bytes, line: int, column: int = 0
 ) -> dict:
@@ -371,27 +471,26 @@ def get_scope_info(
     Returns:
         Dictionary with scope information
     """
-    analyzer = ScopeAnalyzer(language)
-    root = analyzer.build_scope_tree(tree, source)
-    scope = analyzer.find_scope_at(root, line, column)
+    scope = ScopeAnalyzer(language).find_scope_chain_at(tree, source, line, column)
 
     # Build scope chain
     chain = []
     current = scope
     while current:
         chain.append({
-            "type": current.type.value,
+            "type": current.type.label,
             "name": current.name,
             "start_line": current.start_line,
             "end_line": current.end_line,
         })
         current = current.parent
 
+    is_global, is_class, is_function = _SCOPE_FLAGS[scope.type]
     return {
-        "current_scope": scope.type.value,
+        "current_scope": scope.type.label,
         "scope_name": scope.name,
-        "is_global": scope.type == ScopeType.GLOBAL,
-        "is_class": scope.type == ScopeType.CLASS,
-        "is_function": scope.type == ScopeType.FUNCTION,
+        "is_global": is_global,
+        "is_class": is_class,
+        "is_function": is_function,
         "scope_chain": list(reversed(chain)),
     }
@@ -1,20 +1,256 @@
 from __future__ import annotations
 
+import fnmatch
+import hashlib
+import json
 import os
-from collections import defaultdict, deque
+import re
+import sqlite3
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from enum import StrEnum, auto
+from functools import lru_cache, partial
+from importlib import metadata
 from pathlib import Path
-from typing import ClassVar, final
+from typing import TYPE_CHECKING, ClassVar, final
 
 from pydantic import BaseModel, Field
 
+from vibe.core.paths.global_paths import DEPS_CACHE_FILE
 from vibe.core.tools.base import BaseTool, BaseToolConfig, BaseToolState, ToolError
 from vibe.core.tools.builtins.code_intel import get_language_for_file, get_parser
 from vibe.core.tools.builtins.code_intel.ast_utils import find_imports
-from vibe.core.tools.builtins.code_intel.languages import is_supported_file
+from vibe.core.tools.builtins.code_intel.languages import (
+    LANGUAGE_CONFIG,
+    SUPPORTED_EXTENSIONS_SET,
+)
 from vibe.core.tools.ui import ToolCallDisplay, ToolResultDisplay, ToolUIData
 from vibe.core.types import ToolCallEvent, ToolResultEvent
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from vibe.core.tools.builtins.code_intel.parser import CodeParser
+
+# Import fields that are kept; the AST node isn't serializable and would
+# keep the file's whole tree alive in the memo
+_CACHED_IMPORT_KEYS = ("module", "names", "line", "is_relative")
+# Bump when find_imports or the stored row format changes
+_IMPORTS_CACHE_VERSION = 1
+
+
+@lru_cache(maxsize=1)
+def _imports_cache_version() -> int:
+    """Version stamp for cached rows, stored as the database's user_version.
+
+    Combines _IMPORTS_CACHE_VERSION with the installed tree-sitter and
+    grammar versions, since upgrading those can change what is extracted.
+    """
+    parts = [str(_IMPORTS_CACHE_VERSION)]
+    for dist in ("tree_sitter", *(c.ts_module for c in LANGUAGE_CONFIG.values())):
+        try:
+            parts.append(f"{dist}={metadata.version(dist)}")
+        except metadata.PackageNotFoundError:
+            pass
+    digest = hashlib.blake2b("\n".join(parts).encode(), digest_size=4).digest()
+    # user_version is a signed 32-bit integer
+    return int.from_bytes(digest) & 0x7FFFFFFF
+
+
+class _ImportsCache:
+    """Extracted imports per file, memoized for one run and kept on disk.
+
+    Disk entries are keyed by path and content hash, so edited files miss
+    and are re-parsed without any invalidation. The whole store is dropped
+    when the extractor version changes. The disk store is best effort: if
+    the database can't be opened, only the in-run memo is used. Safe to
+    share between the worker threads of one run.
+    """
+
+    def __init__(self, db_path: Path | None) -> None:
+        # None marks a file that couldn't be analyzed
+        self.memo: dict[Path, list[dict] | None] = {}
+        self._pending: list[tuple[str, bytes, str]] = []
+        # Paths whose rows are deleted on close
+        self._stale: list[str] = []
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        if db_path is None:
+            return
+
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            version = _imports_cache_version()
+            if conn.execute("PRAGMA user_version").fetchone()[0] != version:
+                # Rows from another extractor would be served as they are
+                with conn:
+                    conn.execute("DROP TABLE IF EXISTS imports")
+                    conn.execute(f"PRAGMA user_version = {version}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS imports ("
+                "path TEXT NOT NULL, hash BLOB NOT NULL, data TEXT NOT NULL, "
+                "PRIMARY KEY (path, hash))"
+            )
+        except (OSError, sqlite3.Error):
+            return
+        self._conn = conn
+
+    def get(self, path: str, digest: bytes) -> list[dict] | None:
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT data FROM imports WHERE path = ? AND hash = ?",
+                    (path, digest),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return None if row is None else json.loads(row[0])
+
+    def put(self, path: str, digest: bytes, imports: list[dict]) -> None:
+        if self._conn is None:
+            return
+        with self._lock:
+            self._pending.append((path, digest, json.dumps(imports)))
+
+    def prune(self, root: Path) -> None:
+        """Mark the rows of deleted files under a directory for removal.
+
+        Files analyzed this run are known to exist, so only the paths of
+        the other rows are checked.
+        """
+        if self._conn is None:
+            return
+        prefix = os.path.join(str(root), "")
+        # Every path under root sorts between the prefix and the prefix with
+        # its trailing separator bumped, which the primary key index covers
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT DISTINCT path FROM imports WHERE path >= ? AND path < ?",
+                    (prefix, upper),
+                ).fetchall()
+        except sqlite3.Error:
+            return
+        seen = {str(path) for path in self.memo}
+        self._stale.extend(
+            path for (path,) in rows if path not in seen and not os.path.exists(path)
+        )
+
+    def close(self) -> None:
+        """Write new entries in one batch, dropping stale rows, and close."""
+        if self._conn is None:
+            return
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "DELETE FROM imports WHERE path = ?",
+                    [(path,) for path in self._stale],
+                )
+                self._conn.executemany(
+                    "DELETE FROM imports WHERE path = ? AND hash != ?",
+                    [(path, digest) for path, digest, _ in self._pending],
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO imports VALUES (?, ?, ?)", self._pending
+                )
+        except sqlite3.Error:
+            pass
+        finally:
+            self._conn.close()
+            self._conn = None
+
+
+# Supported extensions without the leading dot, for checks on file names
+_SUPPORTED_SUFFIXES = frozenset(ext[1:] for ext in SUPPORTED_EXTENSIONS_SET)
+
+_DEFAULT_EXCLUDE_PATTERNS = (
+    "**/node_modules/**",
+    "**/.git/**",
+    "**/venv/**",
+    "**/.venv/**",
+    "**/__pycache__/**",
+    "**/dist/**",
+    "**/build/**",
+)
+
+
+@lru_cache(maxsize=16)
+def _compile_exclude_patterns(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Combine glob patterns into one regex so each path is matched once."""
+    # An empty alternation would match everything; (?!) matches nothing
+    return re.compile(
+        "|".join(f"(?:{fnmatch.translate(pat)})" for pat in patterns) or "(?!)"
+    )
+
+
+def _read_source(path: Path) -> bytes:
+    """Read a file's contents into one buffer owned by the caller.
+
+    Unbuffered readall sizes its buffer from fstat and reads to EOF, so the
+    contents are copied once. A memory map would skip that copy, but a file
+    truncated while mapped faults the whole process with SIGBUS, and other
+    tools edit files in place while the graph is built.
+    """
+    with open(path, "rb", buffering=0) as f:
+        return f.readall()
+
+
+@lru_cache(maxsize=4096)
+def _dir_entries(directory: str) -> frozenset[str]:
+    """List a directory once so candidate checks are set lookups, not stats."""
+    try:
+        return frozenset(os.listdir(directory))
+    except OSError:
+        return frozenset()
+
+
+@lru_cache(maxsize=4096)
+def _resolve_import_cached(
+    module: str, is_relative: bool, source_dir: str, project_root: str
+) -> str | None:
+    """Resolve an import to a project-relative file path.
+
+    Files in one package share imports, so this saves repeating the same
+    existence checks for every importer, and candidates in one directory
+    share a single listing.
+    """
+    module_path = module.replace(".", "/")
+    if is_relative:
+        # Relative import - resolve relative to source file
+        base = Path(source_dir)
+        candidates = [
+            base / f"{module_path}.py",
+            base / module_path / "__init__.py",
+            base / f"{module_path}.ts",
+            base / f"{module_path}.js",
+        ]
+    else:
+        # Absolute import - resolve from project root
+        base = Path(project_root)
+        candidates = [
+            base / f"{module_path}.py",
+            base / module_path / "__init__.py",
+            base / f"{module_path}.ts",
+            base / f"{module_path}.js",
+            base / f"{module_path}.tsx",
+            base / f"{module_path}.jsx",
+        ]
+
+    for candidate in candidates:
+        if candidate.name in _dir_entries(str(candidate.parent)):
+            try:
+                return str(candidate.relative_to(project_root))
+            except ValueError:
+                pass
+
+    return None
+
 
 class DepOp(StrEnum):
     """Dependency analysis operations."""
@@ -73,17 +309,17 @@ class DependencyConfig(BaseToolConfig):
         default=5000, description="Maximum files to scan"
     )
     exclude_patterns: list[str] = Field(
-        default_factory=lambda: [
-            "**/node_modules/**",
-            "**/.git/**",
-            "**/venv/**",
-            "**/.venv/**",
-            "**/__pycache__/**",
-            "**/dist/**",
-            "**/build/**",
-        ],
+        default_factory=lambda: list(_DEFAULT_EXCLUDE_PATTERNS),
         description="Glob patterns to exclude",
     )
+    persist_imports_cache: bool = Field(
+        default=True,
+        description="Cache extracted imports on disk, keyed by file content",
+    )
+    max_workers: int = Field(
+        default_factory=lambda: os.cpu_count() or 1,
+        description="Threads used to parse files in parallel",
+    )
 
 
 class DependencyState(BaseToolState):
@@ -157,11 +393,24 @@ class DependencyAnalyzer(
         if args.operation == DepOp.IMPORTS:
             return self._analyze_imports(target_path, parser)
 
-        elif args.operation == DepOp.DEPENDENTS:
-            return self._find_dependents(target_path, project_root, parser)
+        imports_cache = _ImportsCache(
+            DEPS_CACHE_FILE.path if self.config.persist_imports_cache else None
+        )
+        try:
+            if args.operation == DepOp.DEPENDENTS:
+                return self._find_dependents(
+                    target_path, project_root, parser, imports_cache
+                )
 
-        elif args.operation == DepOp.GRAPH:
-            return self._build_graph(target_path, project_root, parser, args.depth)
+            elif args.operation == DepOp.GRAPH:
+                return self._build_graph(
+                    target_path, project_root, parser, args.depth, imports_cache
+                )
+        finally:
+            imports_cache.close()
+            # Resolutions are only valid while the tree is unchanged
+            _resolve_import_cached.cache_clear()
+            _dir_entries.cache_clear()
 
         raise ToolError(f"Unknown operation: {args.operation}")
 
@@ -192,9 +441,11 @@ class DependencyAnalyzer(
 
         imports_data = find_imports(tree, language, source)
 
+        # find_imports yields well-typed fields, so skip pydantic validation
+        source_file = str(target_path.relative_to(self.config.effective_workdir))
         imports = [
-            ImportInfo(
-                source_file=str(target_path.relative_to(self.config.effective_workdir)),
+            ImportInfo.model_construct(
+                source_file=source_file,
                 imported_module=imp["module"],
                 imported_names=imp["names"],
                 line=imp["line"],
@@ -203,14 +454,18 @@ class DependencyAnalyzer(
             for imp in imports_data
         ]
 
-        return DependencyResult(
-            target=str(target_path.relative_to(self.config.effective_workdir)),
+        return DependencyResult.model_construct(
+            target=source_file,
             operation="imports",
             imports=imports,
         )
 
     def _find_dependents(
-        self, target_path: Path, project_root: Path, parser: object
+        self,
+        target_path: Path,
+        project_root: Path,
+        parser: object,
+        imports_cache: _ImportsCache,
     ) -> DependencyResult:
         """Find files that import the target."""
         from vibe.core.tools.builtins.code_intel.parser import CodeParser
@@ -220,44 +475,60 @@ class DependencyAnalyzer(
 
         # Normalize target for matching
         target_rel = str(target_path.relative_to(project_root))
-        target_module = self._path_to_module(target_rel)
+        # An import names the target if it is the target module or one of
+        # its parent packages
+        parts = self._path_to_module(target_rel).split(".")
+        target_keys = frozenset(".".join(parts[:i]) for i in range(1, len(parts) + 1))
 
         files = self._collect_files(project_root)
         dependents = []
+        # Collected files are joined onto the workdir, so their relative
+        # paths are a prefix strip away
+        workdir = self.config.effective_workdir
+        workdir_prefix = os.path.join(workdir, "")
+
+        # Parsing dominates and tree-sitter releases the GIL, so extract in
+        # parallel and match sequentially
+        get_imports = partial(
+            self._get_imports, parser=parser, imports_cache=imports_cache
+        )
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            all_imports = list(executor.map(get_imports, files))
+        # This scanned the whole tree, so drop cached rows of removed files
+        imports_cache.prune(project_root)
 
-        for file_path in files:
-            tree = parser.parse_file(file_path)
-            if tree is None:
-                continue
-
-            language = get_language_for_file(file_path)
-            if language is None:
-                continue
-
-            try:
-                source = file_path.read_bytes()
-            except OSError:
+        for file_path, imports_data in zip(files, all_imports, strict=True):
+            if imports_data is None:
                 continue
 
-            imports_data = find_imports(tree, language, source)
-
             for imp in imports_data:
-                if self._import_matches_target(
-                    imp["module"], imp["is_relative"], file_path, target_path, target_module
-                ):
-                    dependents.append(
-                        str(file_path.relative_to(self.config.effective_workdir))
+                if imp["module"] in target_keys or (
+                    imp["is_relative"]
+                    and self._resolve_import(
+                        imp["module"], True, file_path, project_root
                     )
+                    == target_rel
+                ):
+                    path_str = str(file_path)
+                    if path_str.startswith(workdir_prefix):
+                        dependents.append(path_str[len(workdir_prefix) :])
+                    else:
+                        dependents.append(str(file_path.relative_to(workdir)))
                     break
 
-        return DependencyResult(
+        return DependencyResult.model_construct(
             target=target_rel,
             operation="dependents",
             dependents=dependents,
         )
 
     def _build_graph(
-        self, start_path: Path, project_root: Path, parser: object, depth: int
+        self,
+        start_path: Path,
+        project_root: Path,
+        parser: object,
+        depth: int,
+        imports_cache: _ImportsCache,
     ) -> DependencyResult:
         """Build a dependency graph starting from a file."""
         from vibe.core.tools.builtins.code_intel.parser import CodeParser
@@ -266,94 +537,167 @@ class DependencyAnalyzer(
             raise ToolError("Invalid parser")
 
         graph: dict[str, list[str]] = defaultdict(list)
-        visited: set[str] = set()
-        queue: deque[tuple[Path, int]] = deque([(start_path, 0)])
-
-        while queue:
-            current_path, current_depth = queue.popleft()
-
-            if current_depth > depth:
-                continue
-
-            try:
-                rel_path = str(current_path.relative_to(project_root))
-            except ValueError:
-                continue
-
-            if rel_path in visited:
-                continue
-
-            visited.add(rel_path)
-
-            tree = parser.parse_file(current_path)
-            if tree is None:
-                continue
-
-            language = get_language_for_file(current_path)
-            if language is None:
-                continue
+        get_imports = partial(
+            self._get_imports, parser=parser, imports_cache=imports_cache
+        )
 
-            try:
-                source = current_path.read_bytes()
-            except OSError:
-                continue
+        # Breadth-first in waves: each depth level is parsed in parallel,
+        # then its edges are resolved sequentially to form the next level.
+        # Entries carry their project-relative path, and a file is queued at
+        # most once however many files import it.
+        wave: list[tuple[Path, str]] = []
+        try:
+            wave.append((start_path, str(start_path.relative_to(project_root))))
+        except ValueError:
+            pass
+        queued = {rel_path for _, rel_path in wave}
+
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            for _ in range(depth + 1):
+                if not wave:
+                    break
+                wave = self._expand_wave(
+                    wave, project_root, executor, get_imports, graph, queued
+                )
 
-            imports_data = find_imports(tree, language, source)
+        return DependencyResult.model_construct(
+            target=str(start_path.relative_to(project_root)),
+            operation="graph",
+            graph=dict(graph),
+        )
 
-            for imp in imports_data:
+    def _expand_wave(
+        self,
+        wave: list[tuple[Path, str]],
+        project_root: Path,
+        executor: ThreadPoolExecutor,
+        get_imports: Callable[[Path], list[dict] | None],
+        graph: dict[str, list[str]],
+        queued: set[str],
+    ) -> list[tuple[Path, str]]:
+        """Parse one graph level in parallel and return the next level.
+
+        Edges are added to the graph in wave order, and files not yet queued
+        become the next wave.
+        """
+        paths = [current_path for current_path, _ in wave]
+        next_wave: list[tuple[Path, str]] = []
+        for (current_path, rel_path), imports_data in zip(
+            wave, executor.map(get_imports, paths), strict=True
+        ):
+            for imp in imports_data or ():
                 resolved = self._resolve_import(
                     imp["module"], imp["is_relative"], current_path, project_root
                 )
-                if resolved:
-                    graph[rel_path].append(resolved)
-                    resolved_path = project_root / resolved
-                    if resolved_path.exists() and resolved not in visited:
-                        queue.append((resolved_path, current_depth + 1))
+                if not resolved:
+                    continue
+                graph[rel_path].append(resolved)
+                # Resolution only returns files that exist
+                if resolved not in queued:
+                    queued.add(resolved)
+                    next_wave.append((project_root / resolved, resolved))
+        return next_wave
+
+    def _get_imports(
+        self, file_path: Path, parser: CodeParser, imports_cache: _ImportsCache
+    ) -> list[dict] | None:
+        """Return a file's imports, reading it at most once per run."""
+        if file_path in imports_cache.memo:
+            return imports_cache.memo[file_path]
+
+        imports = self._extract_imports(file_path, parser, imports_cache)
+        imports_cache.memo[file_path] = imports
+        return imports
+
+    def _extract_imports(
+        self, file_path: Path, parser: CodeParser, imports_cache: _ImportsCache
+    ) -> list[dict] | None:
+        """Read a file's imports from the disk cache, parsing only on a miss."""
+        language = get_language_for_file(file_path)
+        if language is None:
+            return None
 
-        return DependencyResult(
-            target=str(start_path.relative_to(project_root)),
-            operation="graph",
-            graph=dict(graph),
+        try:
+            source = _read_source(file_path)
+        except OSError:
+            return None
+        return self._imports_from_source(
+            str(file_path), source, language, parser, imports_cache
         )
 
-    def _collect_files(self, root: Path) -> list[Path]:
-        """Collect all supported files under a directory."""
-        import fnmatch
-        import re
+    def _imports_from_source(
+        self,
+        key: str,
+        source: bytes,
+        language: str,
+        parser: CodeParser,
+        imports_cache: _ImportsCache,
+    ) -> list[dict] | None:
+        """Look up or extract the imports of one file's contents."""
+        digest = hashlib.blake2b(source, digest_size=16).digest()
+        if (imports := imports_cache.get(key, digest)) is not None:
+            return imports
+
+        tree = parser.parse_bytes(source, language)
+        if tree is None:
+            return None
 
-        # Precompile exclude patterns for efficiency
-        compiled_patterns = [
-            re.compile(fnmatch.translate(pat))
-            for pat in self.config.exclude_patterns
+        # Keep only the plain fields, as a disk hit returns, so the tree and
+        # its source can be freed once the imports are extracted
+        imports = [
+            {key: imp[key] for key in _CACHED_IMPORT_KEYS}
+            for imp in find_imports(tree, language, source)
         ]
+        imports_cache.put(key, digest, imports)
+        return imports
 
-        def is_excluded(path_str: str) -> bool:
-            return any(p.match(path_str) for p in compiled_patterns)
+    def _collect_files(self, root: Path) -> list[Path]:
+        """Collect all supported files under a directory."""
+        exclude_re = _compile_exclude_patterns(tuple(self.config.exclude_patterns))
 
-        files = []
+        def is_excluded(path_str: str) -> bool:
+            return exclude_re.match(path_str) is not None
 
-        for dirpath, dirnames, filenames in os.walk(root):
-            # Filter out excluded directories
-            dirnames[:] = [
-                d
-                for d in dirnames
-                if not is_excluded(os.path.join(dirpath, d))
-            ]
+        files: list[Path] = []
+        # Walk with scandir and plain strings, in os.walk's top-down order;
+        # Paths are only built for the files that are returned
+        stack = [str(root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
 
-            for filename in filenames:
-                file_path = Path(dirpath) / filename
+            subdirs: list[str] = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if is_dir:
+                    # Like os.walk, don't descend into symlinked directories
+                    if not entry.is_symlink() and not is_excluded(entry.path):
+                        subdirs.append(entry.path)
+                    continue
 
-                if not is_supported_file(file_path):
+                # Bare file names need no path handling; a leading dot alone
+                # (".py") is a dotfile, not an extension
+                stem, _, ext = entry.name.rpartition(".")
+                if not stem or ext.lower() not in _SUPPORTED_SUFFIXES:
                     continue
 
-                if is_excluded(str(file_path)):
+                if is_excluded(entry.path):
                     continue
 
-                files.append(file_path)
+                files.append(Path(entry.path))
 
                 if len(files) >= self.config.max_files_to_scan:
                     return files
 
+            stack.extend(reversed(subdirs))
+
         return files
 
     def _path_to_module(self, path: str) -> str:
@@ -369,70 +713,12 @@ class DependencyAnalyzer(
         # Convert path separators to dots
         return path.replace("/", ".").replace("\\", ".")
 
-    def _import_matches_target(
-        self,
-        import_module: str,
-        is_relative: bool,
-        source_file: Path,
-        target_path: Path,
-        target_module: str,
-    ) -> bool:
-        """Check if an import matches the target file."""
-        # Direct module match
-        if import_module == target_module:
-            return True
-
-        # Check if import is a prefix of target (package import)
-        if target_module.startswith(import_module + "."):
-            return True
-
-        # For relative imports, resolve and compare
-        if is_relative:
-            resolved = self._resolve_import(
-                import_module, is_relative, source_file, self.config.effective_workdir
-            )
-            if resolved:
-                try:
-                    target_rel = str(target_path.relative_to(self.config.effective_workdir))
-                    return resolved == target_rel
-                except ValueError:
-                    pass
-
-        return False
-
     def _resolve_import(
         self, module: str, is_relative: bool, source_file: Path, project_root: Path
     ) -> str | None:
         """Resolve an import to a file path."""
-        if is_relative:
-            # Relative import - resolve relative to source file
-            source_dir = source_file.parent
-            module_path = module.replace(".", "/")
-
-            candidates = [
-                source_dir / f"{module_path}.py",
-                source_dir / module_path / "__init__.py",
-                source_dir / f"{module_path}.ts",
-                source_dir / f"{module_path}.js",
-            ]
-        else:
-            # Absolute import - resolve from project root
-            module_path = module.replace(".", "/")
-
-            candidates = [
-                project_root / f"{module_path}.py",
-                project_root / module_path / "__init__.py",
-                project_root / f"{module_path}.ts",
-                project_root / f"{module_path}.js",
-                project_root / f"{module_path}.tsx",
-                project_root / f"{module_path}.jsx",
-            ]
-
-        for candidate in candidates:
-            if candidate.exists():
-                try:
-                    return str(candidate.relative_to(project_root))
-                except ValueError:
-                    pass
-
-        return None
+        # Absolute imports don't depend on the importing file's directory
+        source_dir = str(source_file.parent) if is_relative else ""
+        return _resolve_import_cached(
+            module, is_relative, source_dir, str(project_root)
+        )
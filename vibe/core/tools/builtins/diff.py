@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import difflib
 from enum import StrEnum, auto
+from functools import cache
+import os
 from pathlib import Path
+import re
 import shutil
+import stat
+import tempfile
 from typing import TYPE_CHECKING, ClassVar
 
 from pydantic import BaseModel, Field
@@ -19,10 +25,160 @@ from vibe.core.tools.base import (
     ToolPermission,
 )
 from vibe.core.tools.ui import ToolCallDisplay, ToolResultDisplay, ToolUIData
+from vibe.core.utils import iter_stream_line_blocks
 
 if TYPE_CHECKING:
     from vibe.core.types import ToolCallEvent, ToolResultEvent
 
+try:
+    # Native port of difflib with the same output, used when installed
+    import cydifflib  # pyright: ignore[reportMissingImports]
+except ImportError:
+    cydifflib = None
+
+
+# Matches "N files changed, X insertions(+), Y deletions(-)" from --shortstat
+_SHORTSTAT_RE = re.compile(
+    r"(\d+) files? changed"
+    r"(?:, (\d+) insertions?\(\+\))?(?:, (\d+) deletions?\(-\))?"
+)
+# Rough size of one changed line, for estimating a diff's size
+_ESTIMATED_LINE_BYTES = 80
+# Number of file comparisons remembered per tool instance
+_FILE_RESULTS_SIZE = 16
+
+# Overflow files not yet deleted, removed at exit at the latest
+_overflow_files: set[Path] = set()
+
+
+def _remove_overflow_files() -> None:
+    for path in list(_overflow_files):
+        path.unlink(missing_ok=True)
+    _overflow_files.clear()
+
+
+atexit.register(_remove_overflow_files)
+
+
+@cache
+def _git_path() -> str | None:
+    """Absolute path of the git executable, looked up once per process."""
+    return shutil.which("git")
+
+
+def _git_env() -> dict[str, str]:
+    """Environment for git that skips optional locks."""
+    # Status otherwise refreshes the index under a lock, so concurrent
+    # read-only calls would contend on it
+    return {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
+
+
+def _decode_lines(data: bytes) -> list[str]:
+    """Split file contents into lines as reading the file as text would."""
+    # Text mode turns \r\n and lone \r into \n; doing that on the bytes
+    # before one decode is cheaper than reading through a text wrapper
+    text = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return text.decode("utf-8", errors="replace").splitlines(keepends=True)
+
+
+class _DiffLines:
+    """Diff statistics gathered line by line, keeping only the lines shown.
+
+    With an overflow limit, the lines of a diff past max_lines are also kept,
+    up to that many characters, so the whole diff can be written to a file.
+    """
+
+    def __init__(self, max_lines: int, max_overflow_chars: int = 0) -> None:
+        self.max_lines = max_lines
+        # Shown text, as single lines or runs of whole lines
+        self.lines: list[str] = []
+        self.line_count = 0
+        self.additions = 0
+        self.deletions = 0
+        self.headers = 0
+        self.max_overflow_chars = max_overflow_chars
+        # Text past the shown lines, and whether the limit cut it short
+        self.overflow: list[str] = []
+        self.overflow_chars = 0
+        self.overflow_truncated = False
+
+    def add(self, line: str) -> None:
+        self.line_count += 1
+        if self.line_count <= self.max_lines:
+            self.lines.append(line)
+        else:
+            self._write_overflow(line)
+
+        # Dispatch on the first character so most lines take a single test
+        match line[:1]:
+            case "+":
+                if not line.startswith("+++"):
+                    self.additions += 1
+            case "-":
+                if not line.startswith("---"):
+                    self.deletions += 1
+                elif line.startswith("--- "):
+                    self.headers += 1
+            case "d":
+                if line.startswith("diff "):
+                    self.headers += 1
+
+    def add_block(self, block: str) -> None:
+        """Add a run of newline-separated lines, counting them in bulk.
+
+        Each marker is counted with one str.count over the block, rather
+        than testing every line in Python. A "+++" or "---" line also starts
+        with "+" or "-", so those counts are subtracted.
+        """
+        if not block:
+            return
+
+        remaining = self.max_lines - self.line_count
+        self.line_count += block.count("\n") + (not block.endswith("\n"))
+        end = 0
+        if remaining > 0:
+            # Find where the last shown line ends and keep the block up to
+            # there as one slice; the pieces are only ever joined
+            while remaining > 0 and end < len(block):
+                end = block.find("\n", end) + 1 or len(block)
+                remaining -= 1
+            self.lines.append(block[:end])
+        if end < len(block):
+            self._write_overflow(block[end:])
+
+        # Prefix a newline so the first line is found like the others
+        text = "\n" + block
+        self.additions += text.count("\n+") - text.count("\n+++")
+        self.deletions += text.count("\n-") - text.count("\n---")
+        self.headers += text.count("\ndiff ") + text.count("\n--- ")
+
+    def _write_overflow(self, text: str) -> None:
+        """Keep lines past the shown ones, up to the overflow limit."""
+        room = self.max_overflow_chars - self.overflow_chars
+        if room <= 0:
+            self.overflow_truncated = self.max_overflow_chars > 0
+            return
+        if len(text) > room:
+            text = text[:room]
+            self.overflow_truncated = True
+        self.overflow.append(text)
+        self.overflow_chars += len(text)
+
+    def write_overflow(self) -> Path | None:
+        """Write the whole diff to a temp file if it overflowed.
+
+        Returns the file's path, or None if nothing was past the shown lines.
+        """
+        if not self.overflow:
+            return None
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", prefix="vibe-", suffix=".diff", delete=False
+        ) as f:
+            _overflow_files.add(Path(f.name))
+            f.writelines(self.lines)
+            f.writelines(self.overflow)
+        return Path(f.name)
+
 
 class DiffMode(StrEnum):
     FILES = auto()  # Compare two files
@@ -42,10 +198,33 @@ class DiffConfig(BaseToolConfig):
     timeout: int = Field(
         default=30, description="Timeout for git commands in seconds."
     )
-
-
-class DiffState(BaseToolState):
-    pass
+    max_probe_files: int = Field(
+        default=50,
+        description="Summarize instead of showing git diffs touching more files.",
+    )
+    max_probe_bytes: int = Field(
+        default=1024 * 1024,
+        description="Summarize instead of showing git diffs estimated to be larger.",
+    )
+    max_overflow_chars: int = Field(
+        default=10 * 1024 * 1024,
+        description=(
+            "When a diff is truncated, write it in full to a temp file, up to "
+            "this many characters. 0 disables the file."
+        ),
+    )
+    use_cydifflib: bool = Field(
+        default=True,
+        description="Compare files with cydifflib instead of difflib when installed.",
+    )
+    close_fds: bool = Field(
+        default=True,
+        description=(
+            "Close inherited file descriptors when spawning git. Disabling it "
+            "lets the spawn take the faster posix_spawn path, at the cost of "
+            "git inheriting any descriptors vibe has open."
+        ),
+    )
 
 
 class DiffArgs(BaseModel):
@@ -74,6 +253,18 @@ class DiffResult(BaseModel):
     files_changed: int
     was_truncated: bool = False
     mode: str
+    # Temp file holding the full diff when it was truncated
+    overflow_path: Path | None = None
+    # Whether the temp file was itself cut off at max_overflow_chars
+    overflow_truncated: bool = False
+
+
+class DiffState(BaseToolState):
+    # Recent file comparisons, keyed by both paths with their mtime and size
+    # and the context, oldest first
+    file_results: dict[tuple, DiffResult] = Field(default_factory=dict)
+    # Temp file of the last truncated diff, deleted when the next replaces it
+    overflow_path: Path | None = None
 
 
 class Diff(
@@ -107,59 +298,154 @@ class Diff(
         path1 = self._resolve_path(args.path)
         path2 = self._resolve_path(args.path2)
 
-        if not path1.is_file():
-            raise ToolError(f"File not found: {args.path}")
-        if not path2.is_file():
-            raise ToolError(f"File not found: {args.path2}")
+        stat1 = self._stat_file(path1, args.path)
+        stat2 = self._stat_file(path2, args.path2)
 
+        context = args.context_lines if args.context_lines is not None else self.config.context_lines
+
+        # Unchanged files give the same diff, so repeat calls reuse it
+        key = (
+            str(path1), stat1.st_mtime_ns, stat1.st_size,
+            str(path2), stat2.st_mtime_ns, stat2.st_size,
+            context,
+        )
+        results = self.state.file_results
+        # Re-inserting a hit moves it to the end, so the oldest entry is first
+        if (cached := results.pop(key, None)) is None:
+            # Reading, matching and writing any overflow file all block
+            cached = await asyncio.to_thread(
+                self._compare_files, path1, path2, context
+            )
+            if len(results) >= _FILE_RESULTS_SIZE:
+                del results[next(iter(results))]
+        results[key] = cached
+        return cached
+
+    @staticmethod
+    def _stat_file(path: Path, arg: str) -> os.stat_result:
+        """Stat a file to compare, requiring it to be a regular file."""
         try:
-            content1 = path1.read_text(encoding="utf-8", errors="replace").splitlines(keepends=True)
-            content2 = path2.read_text(encoding="utf-8", errors="replace").splitlines(keepends=True)
+            st = path.stat()
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
+            raise ToolError(f"File not found: {arg}")
+        return st
+
+    def _compare_files(self, path1: Path, path2: Path, context: int) -> DiffResult:
+        """Build the unified diff of two files."""
+        try:
+            data1 = path1.read_bytes()
+            data2 = path2.read_bytes()
         except OSError as e:
             raise ToolError(f"Error reading files: {e}")
 
-        context = args.context_lines if args.context_lines is not None else self.config.context_lines
+        # Identical files need no line matching
+        if data1 == data2:
+            return self._process_diff_output(
+                _DiffLines(self.config.max_output_lines), DiffMode.FILES
+            )
+
+        content1 = _decode_lines(data1)
+        content2 = _decode_lines(data2)
 
-        diff_lines = list(difflib.unified_diff(
+        differ = cydifflib if self.config.use_cydifflib and cydifflib else difflib
+        diff_lines = self._new_diff_lines()
+        for line in differ.unified_diff(
             content1,
             content2,
             fromfile=str(path1),
             tofile=str(path2),
             n=context,
-        ))
+        ):
+            diff_lines.add(line)
 
-        return self._process_diff_output(diff_lines, DiffMode.FILES)
+        overflow_path = self._save_overflow(diff_lines)
+        return self._process_diff_output(diff_lines, DiffMode.FILES, overflow_path)
 
     async def _diff_git(self, args: DiffArgs, staged_only: bool) -> DiffResult:
         """Show git diff for a file or all changes."""
-        if not shutil.which("git"):
+        if not _git_path():
             raise ToolError("Git is not installed or not in PATH")
 
         context = args.context_lines if args.context_lines is not None else self.config.context_lines
 
-        cmd = ["git", "diff", f"-U{context}"]
-
+        # Plain patch output: no colour codes, and no external diff drivers
+        # or textconv filters, which can each spawn a program per file
+        options = ["--no-color", "--no-ext-diff", "--no-textconv"]
         if staged_only:
-            cmd.append("--staged")
+            options.append("--staged")
 
         if args.path:
             path = self._resolve_path(args.path)
             if not path.exists():
                 raise ToolError(f"Path not found: {args.path}")
-            cmd.append("--")
-            cmd.append(str(path))
+            options.append("--")
+            options.append(str(path))
+
+        mode = DiffMode.GIT_STAGED if staged_only else DiffMode.GIT
+
+        # Size the change with --shortstat first, so an oversized diff is
+        # summarized without generating the patch at all
+        probe = _DiffLines(1)
+        await self._run_git_diff(["git", "diff", "--shortstat", *options], probe)
+        if not probe.lines:
+            return self._process_diff_output(probe, mode)
+
+        if match := _SHORTSTAT_RE.search(probe.lines[0]):
+            files_changed = int(match.group(1))
+            additions = int(match.group(2) or 0)
+            deletions = int(match.group(3) or 0)
+            estimated_bytes = (additions + deletions) * _ESTIMATED_LINE_BYTES
+            if (
+                files_changed > self.config.max_probe_files
+                or estimated_bytes > self.config.max_probe_bytes
+            ):
+                return DiffResult.model_construct(
+                    diff=(
+                        f"(summary only - diff too large: {files_changed} "
+                        f"file(s), +{additions} -{deletions})"
+                    ),
+                    additions=additions,
+                    deletions=deletions,
+                    files_changed=files_changed,
+                    was_truncated=True,
+                    mode=mode.value,
+                )
+
+        # Count the whole diff as it streams in, but hold on to only the
+        # lines that will be shown
+        diff_lines = self._new_diff_lines()
+        await self._run_git_diff(["git", "diff", f"-U{context}", *options], diff_lines)
+        overflow_path = await asyncio.to_thread(self._save_overflow, diff_lines)
+        return self._process_diff_output(diff_lines, mode, overflow_path)
 
+    async def _run_git_diff(self, cmd: list[str], diff_lines: _DiffLines) -> None:
+        """Run a git diff command, streaming its output into diff_lines."""
         try:
+            # Spawn the resolved executable so PATH is not searched per call
             proc = await asyncio.create_subprocess_exec(
-                *cmd,
+                _git_path() or cmd[0],
+                *cmd[1:],
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=str(self.config.effective_workdir),
+                close_fds=self.config.close_fds,
+                env=_git_env(),
             )
 
+            assert proc.stdout is not None and proc.stderr is not None
+
+            async def read_stdout(stream: asyncio.StreamReader) -> None:
+                async for block in iter_stream_line_blocks(stream):
+                    diff_lines.add_block(block.decode("utf-8", errors="ignore"))
+
             try:
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    proc.communicate(), timeout=self.config.timeout
+                _, stderr_bytes, _ = await asyncio.wait_for(
+                    asyncio.gather(
+                        read_stdout(proc.stdout), proc.stderr.read(), proc.wait()
+                    ),
+                    timeout=self.config.timeout,
                 )
             except TimeoutError:
                 proc.kill()
@@ -173,12 +459,6 @@ class Diff(
                     raise ToolError("Not a git repository")
                 raise ToolError(f"Git error: {stderr}")
 
-            stdout = stdout_bytes.decode("utf-8", errors="ignore") if stdout_bytes else ""
-            diff_lines = stdout.splitlines(keepends=True)
-
-            mode = DiffMode.GIT_STAGED if staged_only else DiffMode.GIT
-            return self._process_diff_output(diff_lines, mode)
-
         except ToolError:
             raise
         except Exception as e:
@@ -191,44 +471,76 @@ class Diff(
             path = self.config.effective_workdir / path
         return path
 
+    def _new_diff_lines(self) -> _DiffLines:
+        """Collector for a diff that is shown to the user."""
+        return _DiffLines(
+            self.config.max_output_lines, self.config.max_overflow_chars
+        )
+
+    def _save_overflow(self, diff_lines: _DiffLines) -> Path | None:
+        """Write an overflowing diff to a file, replacing the previous one.
+
+        Only the last file is kept, so cached comparisons pointing at the
+        replaced one are dropped with it.
+        """
+        if (path := diff_lines.write_overflow()) is None:
+            return None
+
+        if (old := self.state.overflow_path) is not None:
+            old.unlink(missing_ok=True)
+            _overflow_files.discard(old)
+            results = self.state.file_results
+            for key in [k for k, v in results.items() if v.overflow_path == old]:
+                del results[key]
+        self.state.overflow_path = path
+        return path
+
     def _process_diff_output(
-        self, diff_lines: list[str], mode: DiffMode
+        self,
+        diff_lines: _DiffLines,
+        mode: DiffMode,
+        overflow_path: Path | None = None,
     ) -> DiffResult:
-        """Process diff output and calculate statistics."""
-        additions = 0
-        deletions = 0
-        files_changed = 0
+        """Build the result from the collected diff lines and statistics."""
+        files_changed = diff_lines.headers
         was_truncated = False
 
-        for line in diff_lines:
-            if line.startswith("+") and not line.startswith("+++"):
-                additions += 1
-            elif line.startswith("-") and not line.startswith("---"):
-                deletions += 1
-            elif line.startswith("diff ") or line.startswith("--- "):
-                files_changed += 1
-
         # Handle file comparison (counts diff headers, not actual files)
         if mode == DiffMode.FILES:
-            files_changed = 1 if diff_lines else 0
+            files_changed = 1 if diff_lines.line_count else 0
 
         # Truncate if needed
-        if len(diff_lines) > self.config.max_output_lines:
-            diff_lines = diff_lines[: self.config.max_output_lines]
-            diff_lines.append("\n... (output truncated)\n")
+        lines = diff_lines.lines
+        overflow_truncated = diff_lines.overflow_truncated
+        if overflow_path is not None:
+            if overflow_truncated:
+                lines.append(
+                    f"\n... (output truncated, diff up to "
+                    f"{diff_lines.max_overflow_chars:,} characters in "
+                    f"{overflow_path})\n"
+                )
+            else:
+                lines.append(
+                    f"\n... (output truncated, full diff in {overflow_path})\n"
+                )
+            was_truncated = True
+        elif diff_lines.line_count > self.config.max_output_lines:
+            lines.append("\n... (output truncated)\n")
             was_truncated = True
 
-        diff_output = "".join(diff_lines)
+        diff_output = "".join(lines)
         if not diff_output.strip():
             diff_output = "(no differences)"
 
-        return DiffResult(
+        return DiffResult.model_construct(
             diff=diff_output,
-            additions=additions,
-            deletions=deletions,
+            additions=diff_lines.additions,
+            deletions=diff_lines.deletions,
             files_changed=files_changed,
             was_truncated=was_truncated,
             mode=mode.value,
+            overflow_path=overflow_path,
+            overflow_truncated=overflow_path is not None and overflow_truncated,
         )
 
     @classmethod
@@ -272,6 +584,13 @@ class Diff(
         warnings = []
         if result.was_truncated:
             warnings.append("Output was truncated due to size limit")
+        if result.overflow_path and result.overflow_truncated:
+            warnings.append(
+                f"Diff written to {result.overflow_path}, cut off at the "
+                "overflow size limit"
+            )
+        elif result.overflow_path:
+            warnings.append(f"Full diff written to {result.overflow_path}")
 
         # Show diff preview
         details = result.diff if result.diff != "(no differences)" else None
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import asyncio
 from enum import StrEnum, auto
+from functools import cache
+import os
 import shutil
+import time
 from typing import TYPE_CHECKING, ClassVar
 
 from pydantic import BaseModel, Field
@@ -17,11 +20,29 @@ from vibe.core.tools.base import (
     ToolPermission,
 )
 from vibe.core.tools.ui import ToolCallDisplay, ToolResultDisplay, ToolUIData
+from vibe.core.utils import iter_stream_lines
 
 if TYPE_CHECKING:
     from vibe.core.types import ToolCallEvent, ToolResultEvent
 
 
+# How long a successful repository check is trusted, in seconds
+_REPO_CHECK_TTL = 60.0
+
+
+@cache
+def _git_path() -> str | None:
+    """Absolute path of the git executable, looked up once per process."""
+    return shutil.which("git")
+
+
+def _git_env() -> dict[str, str]:
+    """Environment for git that skips optional locks."""
+    # Status otherwise refreshes the index under a lock, so concurrent
+    # read-only calls would contend on it
+    return {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
+
+
 class GitOperation(StrEnum):
     STATUS = auto()
     ADD = auto()
@@ -47,10 +68,20 @@ class GitConfig(BaseToolConfig):
     max_output_lines: int = Field(
         default=200, description="Maximum output lines."
     )
+    close_fds: bool = Field(
+        default=True,
+        description=(
+            "Close inherited file descriptors when spawning git. Disabling it "
+            "lets the spawn take the faster posix_spawn path, at the cost of "
+            "git inheriting any descriptors vibe has open."
+        ),
+    )
 
 
 class GitState(BaseToolState):
-    pass
+    # Workdirs known to be inside a repository, with the monotonic time of
+    # the check that confirmed it
+    repo_checks: dict[str, float] = Field(default_factory=dict)
 
 
 class GitArgs(BaseModel):
@@ -101,11 +132,13 @@ class Git(
     modifies_state: ClassVar[bool] = True  # Git operations modify repository state
 
     async def run(self, args: GitArgs) -> GitResult:
-        if not shutil.which("git"):
+        if not _git_path():
             raise ToolError("Git is not installed or not in PATH")
 
-        # Check if in a git repo
-        await self._check_git_repo()
+        # Read-only operations report a missing repository from their own
+        # git call, so only mutating ones spawn a separate check first
+        if not self._is_read_only(args):
+            await self._check_git_repo()
 
         match args.operation:
             case GitOperation.STATUS:
@@ -129,41 +162,82 @@ class Git(
             case _:
                 raise ToolError(f"Unknown git operation: {args.operation}")
 
+    @staticmethod
+    def _is_read_only(args: GitArgs) -> bool:
+        """Whether the operation leaves the repository unchanged."""
+        match args.operation:
+            case GitOperation.STATUS | GitOperation.LOG:
+                return True
+            case GitOperation.BRANCH:
+                return not args.branch
+            case _:
+                return False
+
     async def _check_git_repo(self) -> None:
         """Check if we're in a git repository."""
+        key = str(self.config.effective_workdir)
+        checked_at = self.state.repo_checks.get(key)
+        if checked_at is not None and time.monotonic() - checked_at < _REPO_CHECK_TTL:
+            return
+
         cmd = ["git", "rev-parse", "--git-dir"]
         result = await self._run_git_command(cmd, check=False)
         if not result.success:
             raise ToolError("Not a git repository")
+        self.state.repo_checks[key] = time.monotonic()
 
     async def _run_git_command(
         self, cmd: list[str], check: bool = True
     ) -> GitResult:
         """Run a git command and return the result."""
         try:
+            # Spawn the resolved executable so PATH is not searched per call
             proc = await asyncio.create_subprocess_exec(
-                *cmd,
+                _git_path() or cmd[0],
+                *cmd[1:],
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=str(self.config.effective_workdir),
+                close_fds=self.config.close_fds,
+                env=_git_env(),
             )
 
+            assert proc.stdout is not None and proc.stderr is not None
+
+            # Stream stdout and keep only one line past what can be shown,
+            # which is enough to detect truncation; the rest is drained so
+            # git never blocks on a full pipe
+            max_lines = self.config.max_output_lines
+            stdout_lines: list[str] = []
+
+            async def read_stdout(stream: asyncio.StreamReader) -> None:
+                async for line in iter_stream_lines(stream):
+                    if len(stdout_lines) <= max_lines:
+                        stdout_lines.append(line.decode("utf-8", errors="ignore"))
+
             try:
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    proc.communicate(), timeout=self.config.timeout
+                _, stderr_bytes, _ = await asyncio.wait_for(
+                    asyncio.gather(
+                        read_stdout(proc.stdout), proc.stderr.read(), proc.wait()
+                    ),
+                    timeout=self.config.timeout,
                 )
             except TimeoutError:
                 proc.kill()
                 await proc.wait()
                 raise ToolError(f"Git command timed out after {self.config.timeout}s")
 
-            stdout = stdout_bytes.decode("utf-8", errors="ignore") if stdout_bytes else ""
+            stdout = "".join(stdout_lines)
             stderr = stderr_bytes.decode("utf-8", errors="ignore") if stderr_bytes else ""
 
             success = proc.returncode == 0
             output = stdout if success else (stderr or stdout)
 
             if check and not success:
+                if "not a git repository" in output.lower():
+                    # The repository went away; check again next time
+                    self.state.repo_checks.pop(str(self.config.effective_workdir), None)
+                    raise ToolError("Not a git repository")
                 raise ToolError(f"Git error: {output.strip()}")
 
             # Truncate if needed
@@ -175,7 +249,7 @@ class Git(
                 was_truncated = True
                 output = "\n".join(lines)
 
-            return GitResult(
+            return GitResult.model_construct(
                 output=output.strip(),
                 operation=cmd[1] if len(cmd) > 1 else "git",
                 success=success,
@@ -195,23 +269,18 @@ class Git(
     async def _git_add(self, args: GitArgs) -> GitResult:
         """Stage files.
 
-        Runs git add first, then fetches status. Both operations are started
-        concurrently to reduce latency - git add typically completes quickly
-        enough that the index is updated before status reads it.
+        Like reset, add and status run sequentially: started together, status
+        could read the index before add updated it, or hold the index lock
+        and make add fail. The status shown always reflects the add.
         """
         if not args.path:
             raise ToolError("path is required for add operation (use '.' for all files)")
 
-        # Start both operations concurrently for reduced latency
-        # git add modifies index, status reads it - add is fast enough that
-        # the index is typically updated before status subprocess starts
         add_cmd = ["git", "add", args.path]
-        add_task = asyncio.create_task(self._run_git_command(add_cmd))
-        status_task = asyncio.create_task(self._git_status())
-
-        # Wait for both to complete
-        result, status_result = await asyncio.gather(add_task, status_task)
+        result = await self._run_git_command(add_cmd)
 
+        # Status must run after add to show the staged state
+        status_result = await self._git_status()
         result.output = f"Staged: {args.path}\n\n{status_result.output}"
         return result
 
@@ -232,6 +301,7 @@ class Git(
             f"-{num_entries}",
             "--oneline",
             "--decorate",
+            "--no-color",
         ]
         return await self._run_git_command(cmd)
 
@@ -245,7 +315,7 @@ class Git(
             return result
         else:
             # List branches
-            cmd = ["git", "branch", "-a", "-v"]
+            cmd = ["git", "branch", "-a", "-v", "--no-color"]
             return await self._run_git_command(cmd)
 
     async def _git_checkout(self, args: GitArgs) -> GitResult:
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import codecs
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, final
+from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
 
 import httpx
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from vibe.core.tools.base import (
     BaseTool,
@@ -17,9 +23,75 @@ from vibe.core.tools.ui import ToolCallDisplay, ToolResultDisplay, ToolUIData
 if TYPE_CHECKING:
     from vibe.core.types import ToolCallEvent, ToolResultEvent
 
+try:
+    # Native JSON encoder, used for request bodies when installed
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:
+    orjson = None
+
 
 HttpMethod = Literal["GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"]
 
+# Clients are bound to the event loop they first ran on, so one is kept per
+# loop and shared by all requests to reuse connections and TLS sessions
+_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    WeakKeyDictionary()
+)
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        # An empty allow list rejects every cookie, so the shared client
+        # never carries cookies from one request into the next
+        cookies = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+        client = _clients[loop] = httpx.AsyncClient(cookies=cookies)
+    return client
+
+
+def _close_clients() -> None:
+    """Close the shared clients whose event loop can still run them."""
+    for loop, client in list(_clients.items()):
+        # A closed loop can no longer run the close, and a running one can't
+        # be re-entered
+        if client.is_closed or loop.is_closed() or loop.is_running():
+            continue
+        try:
+            loop.run_until_complete(client.aclose())
+        except Exception:
+            pass
+
+
+atexit.register(_close_clients)
+
+
+def _encode_json(
+    data: dict[str, Any] | list[Any], headers: dict[str, str]
+) -> dict[str, Any] | None:
+    """Encode a JSON body with orjson as request kwargs, if it can.
+
+    Returns None when orjson is missing or the body is something only the
+    standard encoder handles, such as an integer beyond 64 bits.
+    """
+    if orjson is None:
+        return None
+    try:
+        content = orjson.dumps(data)
+    except orjson.JSONEncodeError:
+        return None
+    # httpx only sets the content type when the caller has not
+    if not any(name.lower() == "content-type" for name in headers):
+        headers = {**headers, "Content-Type": "application/json"}
+    return {"content": content, "headers": headers}
+
+
+def _host_rules(hosts: list[str]) -> tuple[frozenset[str], tuple[str, ...]]:
+    """Split host patterns into exact matches and subdomain suffixes."""
+    lowered = [host.lower() for host in hosts]
+    return frozenset(lowered), tuple(f".{host}" for host in lowered)
+
 
 class HttpRequestArgs(BaseModel):
     url: str = Field(description="The URL to send the request to.")
@@ -76,6 +148,29 @@ class HttpRequestConfig(BaseToolConfig):
         description="Block requests to these hosts.",
     )
 
+    # Lowercased exact hosts and ".host" suffixes, built once at validation
+    _blocked_exact: frozenset[str] = frozenset()
+    _blocked_suffixes: tuple[str, ...] = ()
+    _allowed_exact: frozenset[str] = frozenset()
+    _allowed_suffixes: tuple[str, ...] = ()
+
+    @model_validator(mode="after")
+    def _compile_host_rules(self) -> HttpRequestConfig:
+        """Lowercase the host lists once instead of on every request."""
+        self._blocked_exact, self._blocked_suffixes = _host_rules(self.blocked_hosts)
+        self._allowed_exact, self._allowed_suffixes = _host_rules(self.allowed_hosts)
+        return self
+
+    def is_host_blocked(self, host: str) -> bool:
+        """Whether a lowercase host or one of its parent domains is blocked."""
+        return host in self._blocked_exact or host.endswith(self._blocked_suffixes)
+
+    def is_host_allowed(self, host: str) -> bool:
+        """Whether a lowercase host passes the allow list, if one is set."""
+        if not self.allowed_hosts:
+            return True
+        return host in self._allowed_exact or host.endswith(self._allowed_suffixes)
+
 
 class HttpRequestState(BaseToolState):
     request_count: int = 0
@@ -93,8 +188,6 @@ class HttpRequest(
 
     @final
     async def run(self, args: HttpRequestArgs) -> HttpRequestResult:
-        from urllib.parse import urlparse
-
         # Validate URL
         parsed = urlparse(args.url)
         if not parsed.scheme:
@@ -105,51 +198,56 @@ class HttpRequest(
         host = parsed.netloc.lower()
 
         # Check host restrictions
-        if self.config.blocked_hosts:
-            for blocked in self.config.blocked_hosts:
-                if host == blocked.lower() or host.endswith(f".{blocked.lower()}"):
-                    raise ToolError(f"Host '{host}' is blocked")
-
-        if self.config.allowed_hosts:
-            allowed = False
-            for allow in self.config.allowed_hosts:
-                if host == allow.lower() or host.endswith(f".{allow.lower()}"):
-                    allowed = True
-                    break
-            if not allowed:
-                raise ToolError(f"Host '{host}' is not in the allowed list")
+        if self.config.is_host_blocked(host):
+            raise ToolError(f"Host '{host}' is blocked")
+
+        if not self.config.is_host_allowed(host):
+            raise ToolError(f"Host '{host}' is not in the allowed list")
 
         # Validate body options
         if args.body and args.json_body:
             raise ToolError("Cannot specify both 'body' and 'json_body'")
 
         try:
-            async with httpx.AsyncClient(
-                follow_redirects=args.follow_redirects,
-                timeout=args.timeout,
-            ) as client:
-                # Build request kwargs
-                kwargs: dict[str, Any] = {
-                    "method": args.method,
-                    "url": args.url,
-                    "headers": args.headers,
-                }
-
-                if args.json_body is not None:
+            # Build request kwargs; timeout and redirects are set per request
+            # so the shared client can serve every call
+            kwargs: dict[str, Any] = {
+                "method": args.method,
+                "url": args.url,
+                "headers": args.headers,
+                "timeout": args.timeout,
+                "follow_redirects": args.follow_redirects,
+            }
+
+            if args.json_body is not None:
+                if encoded := _encode_json(args.json_body, args.headers):
+                    kwargs.update(encoded)
+                else:
                     kwargs["json"] = args.json_body
-                elif args.body is not None:
-                    kwargs["content"] = args.body
+            elif args.body is not None:
+                kwargs["content"] = args.body
 
-                response = await client.request(**kwargs)
+            # Stream the body and stop once past the limit, so an oversized
+            # response is neither fully downloaded nor decoded
+            max_bytes = self.config.max_response_bytes
+            content = bytearray()
+            was_truncated = False
+            async with _get_client().stream(**kwargs) as response:
+                async for chunk in response.aiter_bytes():
+                    content += chunk
+                    if len(content) > max_bytes:
+                        was_truncated = True
+                        del content[max_bytes:]
+                        break
 
             # Process response
-            response_headers = dict(response.headers)
-            body = response.text
-
-            was_truncated = False
-            if len(body) > self.config.max_response_bytes:
-                body = body[: self.config.max_response_bytes]
-                was_truncated = True
+            # dict() on Headers looks up each key with a scan of every header;
+            # items() merges repeated headers into the same pairs in one pass
+            response_headers = dict(response.headers.items())
+            # Decode incrementally so a character cut off by truncation is
+            # dropped rather than replaced
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")
+            body = decoder(errors="replace").decode(content, final=not was_truncated)
 
             # Update state
             self.state.request_count += 1
@@ -157,7 +255,7 @@ class HttpRequest(
             # Get status text
             status_text = httpx.codes.get_reason_phrase(response.status_code)
 
-            return HttpRequestResult(
+            return HttpRequestResult.model_construct(
                 url=args.url,
                 final_url=str(response.url),
                 method=args.method,
@@ -179,8 +277,6 @@ class HttpRequest(
         if not isinstance(event.args, HttpRequestArgs):
             return ToolCallDisplay(summary="http_request")
 
-        from urllib.parse import urlparse
-
         parsed = urlparse(event.args.url)
         path = parsed.path or "/"
         if len(path) > 30:
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import base64
+from functools import cache
+import io
 from pathlib import Path
+import struct
+from types import ModuleType
 from typing import TYPE_CHECKING, ClassVar, final
 
 from pydantic import BaseModel, Field
@@ -15,10 +20,17 @@ from vibe.core.tools.base import (
     ToolPermission,
 )
 from vibe.core.tools.ui import ToolCallDisplay, ToolResultDisplay, ToolUIData
+from vibe.core.utils import logger
 
 if TYPE_CHECKING:
     from vibe.core.types import ToolCallEvent, ToolResultEvent
 
+try:
+    # SIMD base64 codec with the same output, used when installed
+    import pybase64  # pyright: ignore[reportMissingImports]
+except ImportError:
+    pybase64 = None
+
 
 # Supported image formats and their MIME types
 IMAGE_FORMATS: dict[str, str] = {
@@ -31,6 +43,22 @@ IMAGE_FORMATS: dict[str, str] = {
     ".svg": "image/svg+xml",
     ".ico": "image/x-icon",
 }
+# Listed in the error for an unsupported format
+_SUPPORTED_FORMATS = ", ".join(IMAGE_FORMATS)
+
+
+# Header fields read by _get_image_dimensions, unpacked in place rather than
+# sliced out of the data
+_BE_U16 = struct.Struct(">H")
+_BE_U16_PAIR = struct.Struct(">HH")
+_BE_U32_PAIR = struct.Struct(">II")
+_LE_U16_PAIR = struct.Struct("<HH")
+_LE_U32 = struct.Struct("<I")
+_BMP_SIZE = struct.Struct("<Ii")  # Width, then height, negative if top-down
+
+# Bytes read at a time; a multiple of 3, so base64-encoding each chunk on
+# its own gives the same text as encoding the whole file
+_READ_CHUNK = 3 * 256 * 1024
 
 
 class ImageViewArgs(BaseModel):
@@ -68,49 +96,46 @@ class ImageViewState(BaseToolState):
 
 def _get_image_dimensions(data: bytes) -> tuple[int, int]:
     """Get image dimensions without requiring PIL."""
+    # Each field is unpacked only if the data reaches its offset plus the
+    # field's size; indexing bytes already yields ints without copying
+    size = len(data)
+
     # PNG
     if data[:8] == b"\x89PNG\r\n\x1a\n":
-        if data[12:16] == b"IHDR":
-            width = int.from_bytes(data[16:20], "big")
-            height = int.from_bytes(data[20:24], "big")
-            return width, height
+        if data[12:16] == b"IHDR" and size >= 16 + _BE_U32_PAIR.size:
+            return _BE_U32_PAIR.unpack_from(data, 16)
 
     # JPEG
     if data[:2] == b"\xff\xd8":
         i = 2
-        while i < len(data) - 8:
+        while i < size - 8:
             if data[i] != 0xFF:
                 break
             marker = data[i + 1]
             if marker in (0xC0, 0xC1, 0xC2):  # SOF markers
-                height = int.from_bytes(data[i + 5 : i + 7], "big")
-                width = int.from_bytes(data[i + 7 : i + 9], "big")
+                height, width = _BE_U16_PAIR.unpack_from(data, i + 5)
                 return width, height
-            length = int.from_bytes(data[i + 2 : i + 4], "big")
+            (length,) = _BE_U16.unpack_from(data, i + 2)
             i += 2 + length
 
     # GIF
-    if data[:6] in (b"GIF87a", b"GIF89a"):
-        width = int.from_bytes(data[6:8], "little")
-        height = int.from_bytes(data[8:10], "little")
-        return width, height
+    if data[:6] in (b"GIF87a", b"GIF89a") and size >= 6 + _LE_U16_PAIR.size:
+        return _LE_U16_PAIR.unpack_from(data, 6)
 
     # BMP
-    if data[:2] == b"BM":
-        width = int.from_bytes(data[18:22], "little")
-        height = abs(int.from_bytes(data[22:26], "little", signed=True))
-        return width, height
+    if data[:2] == b"BM" and size >= 18 + _BMP_SIZE.size:
+        width, height = _BMP_SIZE.unpack_from(data, 18)
+        return width, abs(height)
 
     # WebP
     if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
-        if data[12:16] == b"VP8 ":
+        if data[12:16] == b"VP8 " and size >= 26 + _LE_U16_PAIR.size:
             # Lossy WebP
-            width = int.from_bytes(data[26:28], "little") & 0x3FFF
-            height = int.from_bytes(data[28:30], "little") & 0x3FFF
-            return width, height
-        elif data[12:16] == b"VP8L":
+            width, height = _LE_U16_PAIR.unpack_from(data, 26)
+            return width & 0x3FFF, height & 0x3FFF
+        elif data[12:16] == b"VP8L" and size >= 21 + _LE_U32.size:
             # Lossless WebP
-            bits = int.from_bytes(data[21:25], "little")
+            (bits,) = _LE_U32.unpack_from(data, 21)
             width = (bits & 0x3FFF) + 1
             height = ((bits >> 14) & 0x3FFF) + 1
             return width, height
@@ -118,6 +143,84 @@ def _get_image_dimensions(data: bytes) -> tuple[int, int]:
     return 0, 0
 
 
+@cache
+def _pil_image() -> ModuleType | None:
+    """PIL's Image module, imported on first use, or None if not installed."""
+    try:
+        from PIL import Image, __version__
+    except ImportError:
+        return None
+    # Pillow-SIMD releases carry a ".postN" suffix on the Pillow version
+    simd = " (Pillow-SIMD)" if ".post" in __version__ else ""
+    logger.debug("Resizing images with Pillow %s%s", __version__, simd)
+    return Image
+
+
+def _b64encode(data: bytes) -> str:
+    """Base64-encode image data as an ASCII string."""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode("ascii")
+
+
+def _load_image(
+    path: Path, suffix: str, file_size: int, max_dimension: int | None
+) -> tuple[int, int, int, str, bool]:
+    """Read, resize if needed, and base64-encode an image.
+
+    Returns its width, height, size in bytes, base64 data and whether it was
+    resized. Blocking throughout, so it is run on a worker thread.
+    """
+    # Read the first chunk, which holds the header of almost any image,
+    # and only keep the whole file in memory if it has to be resized
+    base64_parts: list[str] = []
+    with open(path, "rb") as f:
+        image_data = f.read(_READ_CHUNK)
+        width, height = _get_image_dimensions(image_data)
+        if (width, height) == (0, 0) and len(image_data) < file_size:
+            # Header past the first chunk; scan the whole file
+            image_data += f.read()
+            width, height = _get_image_dimensions(image_data)
+
+        needs_resize = bool(max_dimension) and (
+            width > max_dimension or height > max_dimension
+        )
+        if needs_resize:
+            image_data += f.read()
+        else:
+            # Encode chunk by chunk, so the raw bytes are never all held
+            size_bytes = len(image_data)
+            base64_parts.append(_b64encode(image_data))
+            while chunk := f.read(_READ_CHUNK):
+                size_bytes += len(chunk)
+                base64_parts.append(_b64encode(chunk))
+
+    # Resize if needed (only with PIL available, otherwise return original)
+    was_resized = False
+    if needs_resize and (Image := _pil_image()) is not None:
+        img = Image.open(io.BytesIO(image_data))
+        # thumbnail() drafts JPEGs itself, decoding at a DCT scale that
+        # stays at least twice the target before resampling
+        img.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+
+        output = io.BytesIO()
+        img_format = "PNG" if suffix == ".png" else "JPEG"
+        img.save(output, format=img_format, quality=85)
+        image_data = output.getvalue()
+
+        width, height = img.size
+        was_resized = True
+
+    # Encode to base64
+    if base64_parts:
+        base64_data = "".join(base64_parts)
+    else:
+        size_bytes = len(image_data)
+        base64_data = _b64encode(image_data)
+
+    return width, height, size_bytes, base64_data, was_resized
+
+
 class ImageView(
     BaseTool[ImageViewArgs, ImageViewResult, ImageViewConfig, ImageViewState],
     ToolUIData[ImageViewArgs, ImageViewResult],
@@ -130,8 +233,6 @@ class ImageView(
 
     @final
     async def run(self, args: ImageViewArgs) -> ImageViewResult:
-        import aiofiles
-
         # Validate and resolve path
         if not args.path.strip():
             raise ToolError("Path cannot be empty")
@@ -158,14 +259,12 @@ class ImageView(
 
         # Check file extension
         suffix = resolved_path.suffix.lower()
-        if suffix not in IMAGE_FORMATS:
+        if (mime_type := IMAGE_FORMATS.get(suffix)) is None:
             raise ToolError(
                 f"Unsupported image format: {suffix}. "
-                f"Supported: {', '.join(IMAGE_FORMATS.keys())}"
+                f"Supported: {_SUPPORTED_FORMATS}"
             )
 
-        mime_type = IMAGE_FORMATS[suffix]
-
         # Check file size
         file_size = resolved_path.stat().st_size
         if file_size > self.config.max_file_size:
@@ -174,36 +273,11 @@ class ImageView(
                 f"(max: {self.config.max_file_size:,} bytes)"
             )
 
-        # Read image
-        async with aiofiles.open(resolved_path, "rb") as f:
-            image_data = await f.read()
-
-        # Get dimensions
-        width, height = _get_image_dimensions(image_data)
-
-        # Resize if needed (only with PIL available)
-        was_resized = False
-        if args.max_dimension and (width > args.max_dimension or height > args.max_dimension):
-            try:
-                from PIL import Image
-                import io
-
-                img = Image.open(io.BytesIO(image_data))
-                img.thumbnail((args.max_dimension, args.max_dimension), Image.Resampling.LANCZOS)
-
-                output = io.BytesIO()
-                img_format = "PNG" if suffix == ".png" else "JPEG"
-                img.save(output, format=img_format, quality=85)
-                image_data = output.getvalue()
-
-                width, height = img.size
-                was_resized = True
-            except ImportError:
-                # PIL not available, return original
-                pass
-
-        # Encode to base64
-        base64_data = base64.b64encode(image_data).decode("ascii")
+        # Reading, resizing and encoding are all blocking, so do them in one
+        # worker thread rather than a thread hop per read
+        width, height, size_bytes, base64_data, was_resized = await asyncio.to_thread(
+            _load_image, resolved_path, suffix, file_size, args.max_dimension
+        )
 
         # Update state
         self.state.viewed_images.append(str(resolved_path))
@@ -216,7 +290,7 @@ class ImageView(
             mime_type=mime_type,
             width=width,
             height=height,
-            size_bytes=len(image_data),
+            size_bytes=size_bytes,
             base64_data=base64_data,
             was_resized=was_resized,
         )
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
 import fnmatch
 import os
-from datetime import datetime
+import re
+import stat
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from vibe.core.tools.base import (
     BaseTool,
@@ -20,6 +24,8 @@ from vibe.core.tools.base import (
 from vibe.core.tools.ui import ToolCallDisplay, ToolResultDisplay, ToolUIData
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from vibe.core.types import ToolCallEvent, ToolResultEvent
 
 
@@ -49,6 +55,37 @@ class ListDirConfig(BaseToolConfig):
         ],
         description="Patterns to exclude from listing.",
     )
+    scan_workers: int = Field(
+        default=8,
+        ge=1,
+        description="Threads reading subdirectories ahead in recursive listings.",
+    )
+
+    # Patterns without wildcards as a set, the rest as one combined regex,
+    # both built once at validation
+    _exclude_names: frozenset[str] = frozenset()
+    _exclude_re: re.Pattern[str] | None = None
+
+    @model_validator(mode="after")
+    def _compile_exclude_patterns(self) -> ListDirConfig:
+        """Compile the exclusion patterns once instead of per entry."""
+        names: set[str] = set()
+        globs: list[str] = []
+        for pattern in map(os.path.normcase, self.exclude_patterns):
+            if any(c in pattern for c in "*?["):
+                globs.append(f"(?:{fnmatch.translate(pattern)})")
+            else:
+                names.add(pattern)
+        self._exclude_names = frozenset(names)
+        self._exclude_re = re.compile("|".join(globs)) if globs else None
+        return self
+
+    def is_excluded(self, name: str) -> bool:
+        """Whether a name matches any exclusion pattern, as fnmatch would."""
+        name = os.path.normcase(name)
+        if name in self._exclude_names:
+            return True
+        return self._exclude_re is not None and self._exclude_re.match(name) is not None
 
 
 class ListDirState(BaseToolState):
@@ -72,6 +109,10 @@ class ListDirArgs(BaseModel):
         default=True,
         description="If True, include file sizes in the output.",
     )
+    show_modified: bool = Field(
+        default=True,
+        description="If True, include modification times in the output.",
+    )
     max_depth: int | None = Field(
         default=None,
         description="Override the default max depth for recursive listing.",
@@ -103,12 +144,101 @@ def _format_size(size: int) -> str:
     return f"{size:.1f}PB"
 
 
-def _should_exclude(name: str, exclude_patterns: list[str]) -> bool:
-    """Check if a name matches any exclusion pattern."""
-    for pattern in exclude_patterns:
-        if fnmatch.fnmatch(name, pattern):
-            return True
-    return False
+def _entry_is_dir(entry: os.DirEntry[str]) -> bool:
+    """Whether an entry is a directory, following symlinks like Path.is_dir."""
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _sort_key(entry: os.DirEntry[str]) -> tuple[bool, str]:
+    """Order directories first, then by case-insensitive name."""
+    return not _entry_is_dir(entry), entry.name.lower()
+
+
+def _scan_sorted(
+    dir_path: str, prefetch_stat: bool = False
+) -> list[os.DirEntry[str]]:
+    """Entries of a directory in listing order, or none if unreadable.
+
+    With prefetch_stat, each entry's stat is also fetched, so it is already cached
+    when read on another thread.
+    """
+    # scandir yields each entry's type with its name, and caches its stat,
+    # so an entry costs at most one stat call
+    try:
+        with os.scandir(dir_path) as it:
+            items = sorted(it, key=_sort_key)
+    except OSError:
+        return []
+    if prefetch_stat:
+        for item in items:
+            try:
+                item.stat()
+            except OSError:
+                pass
+    return items
+
+
+class _ReadAhead:
+    """Reads the directories a walk is about to enter on a thread pool.
+
+    Directories are queued in the order the walk enters them, and at most
+    one read per worker is pending at a time, so a wide tree doesn't queue
+    a read for every directory it contains.
+    """
+
+    def __init__(
+        self, pool: ThreadPoolExecutor, workers: int, prefetch_stat: bool
+    ) -> None:
+        self._pool = pool
+        self._workers = workers
+        self._prefetch_stat = prefetch_stat
+        self._ahead: dict[str, Future[list[os.DirEntry[str]]]] = {}
+        # Directories not yet read, the next one the walk enters at the end
+        self._queued: list[str] = []
+        # The queued directories still unread, so a walk that enters or
+        # skips one out of order drops it wherever it is queued
+        self._pending: set[str] = set()
+
+    def read(self, dir_path: str) -> list[os.DirEntry[str]]:
+        """The entries of a directory the walk enters, read ahead or now."""
+        self._pending.discard(dir_path)
+        future = self._ahead.pop(dir_path, None)
+        return future.result() if future else _scan_sorted(dir_path)
+
+    def queue(self, subdirs: list[str]) -> None:
+        """Queue the subdirectories of the directory just read."""
+        self._queued.extend(reversed(subdirs))
+        self._pending.update(subdirs)
+        self._fill()
+
+    def skip(self, dir_path: str) -> None:
+        """Drop a queued directory the walk won't enter.
+
+        Happens when an entry's stat disagrees with its listed type. A read
+        nobody consumes would hold a worker slot for the rest of the walk.
+        """
+        self._pending.discard(dir_path)
+        if (future := self._ahead.pop(dir_path, None)) is not None:
+            future.cancel()
+            self._fill()
+
+    def cancel(self) -> None:
+        """Cancel the reads that haven't started."""
+        for future in self._ahead.values():
+            future.cancel()
+
+    def _fill(self) -> None:
+        while self._queued and len(self._ahead) < self._workers:
+            dir_path = self._queued.pop()
+            # Directories the walk already read or skipped are left out
+            if dir_path in self._pending:
+                self._pending.discard(dir_path)
+                self._ahead[dir_path] = self._pool.submit(
+                    _scan_sorted, dir_path, self._prefetch_stat
+                )
 
 
 class ListDir(
@@ -154,7 +284,9 @@ class ListDir(
         total_dirs = 0
         was_truncated = False
 
-        for match_path in glob.glob(pattern, recursive=args.recursive):
+        # iglob yields matches as it finds them, so hitting the limit stops
+        # the search instead of trimming a fully built list
+        for match_path in glob.iglob(pattern, recursive=args.recursive):
             if len(entries) >= self.config.max_entries:
                 was_truncated = True
                 break
@@ -167,10 +299,10 @@ class ListDir(
                 continue
 
             # Skip excluded patterns
-            if _should_exclude(name, self.config.exclude_patterns):
+            if self.config.is_excluded(name):
                 continue
 
-            entry = self._create_entry(path_obj, args.show_size)
+            entry = self._create_entry(path_obj, args.show_size, args.show_modified)
             entries.append(entry)
 
             if entry.is_dir:
@@ -190,6 +322,11 @@ class ListDir(
         self, args: ListDirArgs, base_path: Path
     ) -> ListDirResult:
         """List contents of a directory."""
+        # The walk is all blocking syscalls, so keep it off the event loop
+        return await asyncio.to_thread(self._walk_directory, args, base_path)
+
+    def _walk_directory(self, args: ListDirArgs, base_path: Path) -> ListDirResult:
+        """Walk a directory, reading subdirectories ahead on a thread pool."""
         max_depth = args.max_depth if args.max_depth is not None else self.config.max_depth
 
         entries: list[FileEntry] = []
@@ -197,48 +334,73 @@ class ListDir(
         total_dirs = 0
         was_truncated = False
 
-        def collect_entries(dir_path: Path, current_depth: int) -> bool:
-            nonlocal total_files, total_dirs, was_truncated
-
-            if current_depth > max_depth:
-                return True
-
-            try:
-                items = sorted(dir_path.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower()))
-            except PermissionError:
-                return True
-            except OSError:
-                return True
+        # Entries under base_path start with this, so the rest is their
+        # relative path
+        base_prefix = os.path.join(str(base_path), "")
+        # Entries are only stat'ed for their size or time
+        needs_stat = args.show_size or args.show_modified
+
+        def is_listed(item: os.DirEntry[str]) -> bool:
+            # Skip hidden files if not requested, and excluded patterns
+            if not args.include_hidden and item.name.startswith("."):
+                return False
+            return not self.config.is_excluded(item.name)
+
+        with ThreadPoolExecutor(max_workers=self.config.scan_workers) as pool:
+            reader = _ReadAhead(pool, self.config.scan_workers, needs_stat)
+
+            def scan(dir_path: str, depth: int) -> Iterator[os.DirEntry[str]]:
+                items = reader.read(dir_path)
+                # Queue the subdirectories the walk will enter, so their
+                # listing and stat calls overlap with this one's
+                subdirs: list[str] = []
+                if args.recursive and depth < max_depth:
+                    subdirs = [
+                        item.path
+                        for item in items
+                        if is_listed(item) and _entry_is_dir(item)
+                    ]
+                reader.queue(subdirs)
+                return iter(items)
+
+            # Walk depth-first with a stack of per-directory iterators, which
+            # lists entries in the same order as recursing into each directory
+            # where it appears, without a Python call per directory
+            stack: list[tuple[Iterator[os.DirEntry[str]], int]] = []
+            if max_depth >= 0:
+                stack.append((scan(str(base_path), 0), 0))
+
+            while stack:
+                items, depth = stack[-1]
+                item = next(items, None)
+                if item is None:
+                    stack.pop()
+                    continue
 
-            for item in items:
                 if len(entries) >= self.config.max_entries:
                     was_truncated = True
-                    return False
-
-                name = item.name
+                    break
 
-                # Skip hidden files if not requested
-                if not args.include_hidden and name.startswith("."):
+                if not is_listed(item):
                     continue
 
-                # Skip excluded patterns
-                if _should_exclude(name, self.config.exclude_patterns):
-                    continue
-
-                entry = self._create_entry(item, args.show_size, base_path)
+                display_path = item.path[len(base_prefix) :]
+                entry = self._create_entry(
+                    item, args.show_size, args.show_modified, display_path
+                )
                 entries.append(entry)
 
                 if entry.is_dir:
                     total_dirs += 1
-                    if args.recursive and current_depth < max_depth:
-                        if not collect_entries(item, current_depth + 1):
-                            return False
+                    if args.recursive and depth < max_depth:
+                        stack.append((scan(item.path, depth + 1), depth + 1))
                 else:
                     total_files += 1
+                    if args.recursive and depth < max_depth:
+                        reader.skip(item.path)
 
-            return True
-
-        collect_entries(base_path, 0)
+            # Drop reads the walk no longer needs before the pool shuts down
+            reader.cancel()
 
         return ListDirResult(
             entries=entries,
@@ -250,7 +412,7 @@ class ListDir(
 
     def _single_file_result(self, path: Path, args: ListDirArgs) -> ListDirResult:
         """Create result for a single file."""
-        entry = self._create_entry(path, args.show_size)
+        entry = self._create_entry(path, args.show_size, args.show_modified)
         return ListDirResult(
             entries=[entry],
             total_files=1,
@@ -260,31 +422,46 @@ class ListDir(
         )
 
     def _create_entry(
-        self, path: Path, show_size: bool, base_path: Path | None = None
+        self,
+        path: Path | os.DirEntry[str],
+        show_size: bool,
+        show_modified: bool,
+        display_path: str | None = None,
     ) -> FileEntry:
-        """Create a FileEntry from a path."""
+        """Create a FileEntry from a path or directory entry."""
+        name = path.name
+        if display_path is None:
+            display_path = os.fspath(path)
+
+        if not show_size and not show_modified:
+            # Only the entry type is needed, which a directory entry already
+            # has from the listing, so skip the stat
+            if isinstance(path, os.DirEntry):
+                is_dir = _entry_is_dir(path)
+            else:
+                is_dir = path.is_dir()
+            return FileEntry(name=name, path=display_path, is_dir=is_dir)
+
+        # One stat gives the size, the time and whether this is a directory
         try:
-            stat = path.stat()
-            size = stat.st_size if not path.is_dir() else None
-            modified = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
-        except (OSError, PermissionError):
+            st = path.stat()
+        except OSError:
+            st = None
+
+        is_dir = st is not None and stat.S_ISDIR(st.st_mode)
+        if st is not None:
+            size = st.st_size if not is_dir else None
+            modified = time.strftime("%Y-%m-%d %H:%M", time.localtime(st.st_mtime))
+        else:
             size = None
             modified = None
 
-        # Make path relative to base_path if provided
-        display_path = str(path)
-        if base_path:
-            try:
-                display_path = str(path.relative_to(base_path))
-            except ValueError:
-                pass
-
         return FileEntry(
-            name=path.name,
+            name=name,
             path=display_path,
-            is_dir=path.is_dir(),
+            is_dir=is_dir,
             size=size if show_size else None,
-            modified=modified,
+            modified=modified if show_modified else None,
         )
 
     @classmethod
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 from pathlib import Path
+import shutil
+import tempfile
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, final
 
-import aiofiles
 from pydantic import BaseModel, Field
 
 from vibe.core.path_security import PathSecurityError, validate_safe_path
@@ -20,6 +23,12 @@ from vibe.core.tools.ui import ToolCallDisplay, ToolResultDisplay, ToolUIData
 if TYPE_CHECKING:
     from vibe.core.types import ToolCallEvent, ToolResultEvent
 
+try:
+    # Native JSON parser, used for reading notebooks when installed
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:
+    orjson = None
+
 
 CellType = Literal["code", "markdown", "raw"]
 EditMode = Literal["replace", "insert", "delete"]
@@ -67,12 +76,26 @@ class NotebookEditState(BaseToolState):
     modifies_state: ClassVar[bool] = True
 
 
+def _split_source(source: str) -> list[str]:
+    """Split cell source into nbformat lines, each keeping its newline.
+
+    Only "\n" ends a line, as in nbformat; str.splitlines would also split
+    on "\r", form feeds and Unicode line separators inside a line.
+    """
+    lines = source.split("\n")
+    last = lines.pop()
+    result = [f"{line}\n" for line in lines]
+    if last:
+        result.append(last)
+    return result
+
+
 def _create_cell(cell_type: CellType, source: str) -> dict[str, Any]:
     """Create a new notebook cell structure."""
     cell: dict[str, Any] = {
         "cell_type": cell_type,
         "metadata": {},
-        "source": source.split("\n") if source else [],
+        "source": _split_source(source),
     }
 
     # Add execution count for code cells
@@ -83,12 +106,78 @@ def _create_cell(cell_type: CellType, source: str) -> dict[str, Any]:
     return cell
 
 
-def _get_cell_source(cell: dict[str, Any]) -> str:
-    """Extract source from a cell, handling both list and string formats."""
+def _load_notebook(data: bytes) -> Any:
+    """Parse notebook JSON, with orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # The standard parser accepts a little more, such as NaN and
+            # integers beyond 64 bits, and otherwise reports the error
+            pass
+    return json.loads(data)
+
+
+def _write_notebook(path: Path, notebook: dict[str, Any]) -> None:
+    """Write a notebook, replacing an existing one atomically.
+
+    The JSON is streamed to the file rather than built as one string first.
+    """
+    if not path.exists():
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(notebook, f, indent=1, ensure_ascii=False)
+        return
+
+    # Write next to the notebook and rename over it, so a failed write
+    # never leaves it half written and a hard-linked backup keeps the old
+    # contents. The notebook gets a new inode: other hard links to it keep
+    # the old contents, and only its permission bits are carried over
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(notebook, f, indent=1, ensure_ascii=False)
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _backup_notebook(path: Path) -> None:
+    """Save a notebook's current contents next to it as .ipynb.backup.
+
+    The backup is a hard link, so nothing is copied. It stays a snapshot only
+    because _write_notebook replaces an existing notebook with a new file
+    instead of writing into it. Where links are not possible, copyfile copies
+    inside the kernel.
+    """
+    backup_path = path.with_suffix(".ipynb.backup")
+    backup_path.unlink(missing_ok=True)
+    try:
+        os.link(path, backup_path)
+    except OSError:
+        shutil.copyfile(path, backup_path)
+
+
+def _get_cell_source_preview(cell: dict[str, Any], limit: int = 200) -> str:
+    """Extract the start of a cell's source, handling list and string formats.
+
+    Only as many lines as the preview needs are joined.
+    """
     source = cell.get("source", "")
     if isinstance(source, list):
-        return "".join(source)
-    return source
+        parts: list[str] = []
+        length = 0
+        for line in source:
+            if length >= limit:
+                break
+            parts.append(line)
+            length += len(line)
+        source = "".join(parts)
+    return source[:limit]
 
 
 class NotebookEdit(
@@ -155,9 +244,8 @@ class NotebookEdit(
                 raise ToolError(f"Notebook not found: {resolved_path}")
         else:
             try:
-                async with aiofiles.open(resolved_path, encoding="utf-8") as f:
-                    content = await f.read()
-                notebook = json.loads(content)
+                content = await asyncio.to_thread(resolved_path.read_bytes)
+                notebook = _load_notebook(content)
             except json.JSONDecodeError as e:
                 raise ToolError(f"Invalid notebook JSON: {e}")
 
@@ -183,10 +271,7 @@ class NotebookEdit(
 
         # Create backup if configured
         if self.config.create_backup and resolved_path.exists():
-            backup_path = resolved_path.with_suffix(".ipynb.backup")
-            async with aiofiles.open(resolved_path, "rb") as src:
-                async with aiofiles.open(backup_path, "wb") as dst:
-                    await dst.write(await src.read())
+            await asyncio.to_thread(_backup_notebook, resolved_path)
 
         # Perform edit
         result_cell_type: str
@@ -195,7 +280,7 @@ class NotebookEdit(
         if args.mode == "delete":
             deleted_cell = cells.pop(args.cell_index)
             result_cell_type = deleted_cell.get("cell_type", "unknown")
-            source_preview = _get_cell_source(deleted_cell)[:200]
+            source_preview = _get_cell_source_preview(deleted_cell)
 
         elif args.mode == "replace":
             cell = cells[args.cell_index]
@@ -211,7 +296,7 @@ class NotebookEdit(
                     cell.pop("outputs", None)
 
             # Update source
-            cell["source"] = args.source.split("\n") if args.source else []
+            cell["source"] = _split_source(args.source or "")
             result_cell_type = cell["cell_type"]
             source_preview = (args.source or "")[:200]
 
@@ -225,8 +310,7 @@ class NotebookEdit(
 
         # Write notebook
         notebook["cells"] = cells
-        async with aiofiles.open(resolved_path, "w", encoding="utf-8") as f:
-            await f.write(json.dumps(notebook, indent=1, ensure_ascii=False))
+        await asyncio.to_thread(_write_notebook, resolved_path, notebook)
 
         # Update state
         self.state.edited_notebooks.append(str(resolved_path))
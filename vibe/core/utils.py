@@ -273,3 +273,46 @@ def run_sync[T](coro: Coroutine[Any, Any, T]) -> T:
 
 def is_windows() -> bool:
     return sys.platform == "win32"
+
+
+async def iter_stream_lines(
+    stream: asyncio.StreamReader, chunk_size: int = 64 * 1024
+) -> AsyncGenerator[bytes]:
+    """Yield the lines of a stream as they arrive, line endings included.
+
+    Unlike StreamReader.readline, lines of any length are accepted: the
+    stream is read in fixed-size chunks and only the current line is buffered.
+    """
+    buffer = bytearray()
+    while chunk := await stream.read(chunk_size):
+        # Earlier bytes were already searched for a newline
+        search_from = len(buffer)
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", search_from)) >= 0:
+            yield bytes(buffer[start : end + 1])
+            start = search_from = end + 1
+        del buffer[:start]
+    if buffer:
+        yield bytes(buffer)
+
+
+async def iter_stream_line_blocks(
+    stream: asyncio.StreamReader, chunk_size: int = 64 * 1024
+) -> AsyncGenerator[bytes]:
+    """Yield a stream in blocks that each end on a line boundary.
+
+    Every block holds one or more whole lines, so callers can scan many lines
+    at once; only the final block may lack a trailing newline.
+    """
+    buffer = bytearray()
+    while chunk := await stream.read(chunk_size):
+        cut = chunk.rfind(b"\n") + 1
+        if not cut:
+            buffer += chunk
+            continue
+        buffer += chunk[:cut]
+        yield bytes(buffer)
+        buffer = bytearray(chunk[cut:])
+    if buffer:
+        yield bytes(buffer)